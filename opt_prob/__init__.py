@@ -1,3 +1,10 @@
-from .cons import Cons
+from .cons import Cons, FeasibilityChecker
 from .non_cons import NonCons
-from .debug import plot
\ No newline at end of file
+from .debug import plot
+from .structure import structure_of
+from .catalog import info, select
+from .penalty import StaticPenalty, AdaptivePenalty, AugLagrangian
+from .noise import Noisy
+from .latency import Slow, lognormal_delay
+from .transform import Normalized, Scaled, ShiftedRotated, rotation_of
+from . import lipschitz
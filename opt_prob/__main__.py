@@ -0,0 +1,196 @@
+"""
+Command line entry points:
+
+    python -m opt_prob serve [--host HOST] [--port PORT] [--unix PATH]
+    python -m opt_prob eval NAME [--in FILE] [--out FILE] [--cns] [--workers N]
+
+eval reads points from a .npy or .csv file, or from stdin ('-', the
+default), one point per row, and writes one row of values per point to a
+.npy or .csv file or to stdout. Points are evaluated `--chunk` rows at a
+time, so inputs larger than memory stream through when read as CSV or
+from a .npy file. An empty input gives an empty result, of shape (0,) or
+(0, number of cns).
+"""
+
+import argparse
+import asyncio
+import collections
+import contextlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+def serve(args):
+    from .server import Server
+    server = Server(window=args.window, max_batch=args.max_batch, max_bytes=args.max_bytes)
+    asyncio.run(server.serve(host=args.host, port=args.port, path=args.unix))
+
+
+def read_chunks(path, fmt, chunk):
+
+    """ yield the total number of rows or None, then the input points, chunk rows at a time """
+
+    if fmt == 'npy' and path != '-':
+        X = np.load(path, mmap_mode='r')
+        X = X.reshape(X.shape[0], int(np.prod(X.shape[1:]))) # also with 0 rows
+        yield X.shape[0]
+        for i in range(0, X.shape[0], chunk):
+            yield np.array(X[i:i+chunk], dtype=float)
+    elif fmt == 'npy':
+        stream = sys.stdin.buffer
+        version = np.lib.format.read_magic(stream)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(stream)
+        else:
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(stream)
+        if fortran:
+            raise ValueError("Fortran ordered .npy input is not supported on stdin.")
+        d = int(np.prod(shape[1:]))
+        yield shape[0]
+        for i in range(0, shape[0], chunk):
+            rows = min(chunk, shape[0] - i)
+            data = stream.read(rows*d*dtype.itemsize)
+            yield np.frombuffer(data, dtype=dtype).reshape(rows, d).astype(float)
+    else:
+        yield None
+        if path == '-':
+            for X in read_csv(sys.stdin, chunk):
+                yield X
+        else:
+            with open(path) as stream:
+                for X in read_csv(stream, chunk):
+                    yield X
+
+
+def read_csv(stream, chunk):
+
+    """ yield the points of a CSV stream, chunk rows at a time """
+
+    lines = []
+    for line in stream:
+        if line.strip():
+            lines.append(line)
+        if len(lines) == chunk:
+            yield np.loadtxt(lines, delimiter=',', ndmin=2)
+            lines = []
+    if lines:
+        yield np.loadtxt(lines, delimiter=',', ndmin=2)
+
+
+def bounded_map(executor, func, items, limit):
+
+    """ executor.map that keeps at most limit calls in flight, results in order """
+
+    futures = collections.deque()
+    for item in items:
+        if len(futures) == limit:
+            yield futures.popleft().result()
+        futures.append(executor.submit(func, item))
+    while futures:
+        yield futures.popleft().result()
+
+
+def evaluate(args):
+
+    from . import aio
+    from .server import get_problem, values_per_point
+
+    fmt_in = args.format or ('npy' if args.input.endswith('.npy') else 'csv')
+    fmt_out = args.out_format or ('npy' if args.output.endswith('.npy') else 'csv')
+    method = 'cns_batch' if args.cns else 'obj_batch'
+
+    with contextlib.ExitStack() as stack:
+        chunks = stack.enter_context(contextlib.closing(read_chunks(args.input, fmt_in, args.chunk)))
+        n = next(chunks)
+        first = next(chunks, None)
+
+        if first is None: # no points, still write an empty result
+            problem = get_problem(args.name, dtype=args.dtype)
+            m = values_per_point(problem, method)
+            n = 0
+            results = [np.empty((0,) if method == 'obj_batch' else (0, m), dtype=problem.dtype)]
+        else:
+            d = first.shape[1]
+            problem = get_problem(args.name, d, args.dtype)
+            if d != len(problem.lb):
+                raise ValueError("{} has {} variables, the input has {} columns.".format(
+                    args.name, len(problem.lb), d))
+
+            def chunks_of():
+                yield first
+                for X in chunks:
+                    yield X
+
+            if args.workers > 1:
+                executor = stack.enter_context(ProcessPoolExecutor(args.workers))
+                results = bounded_map(executor, aio._task(problem, method, executor), chunks_of(), 2*args.workers)
+            else:
+                results = (getattr(problem, method)(X) for X in chunks_of())
+
+        if args.output == '-':
+            out = sys.stdout.buffer
+            stack.callback(out.flush)
+        else:
+            out = stack.enter_context(open(args.output, 'wb'))
+
+        if fmt_out == 'npy':
+            if n is None:
+                Y = np.concatenate(list(results))
+                np.save(out, Y)
+            else:
+                header_written = False
+                for Y in results:
+                    if not header_written:
+                        header = {'descr': problem.dtype.str, 'fortran_order': False, 'shape': (n,) + Y.shape[1:]}
+                        np.lib.format.write_array_header_1_0(out, header)
+                        header_written = True
+                    out.write(np.ascontiguousarray(Y, dtype=problem.dtype).tobytes())
+        else:
+            fmt = '%.9g' if problem.dtype.itemsize == 4 else '%.17g'
+            for Y in results:
+                np.savetxt(out, Y, delimiter=',', fmt=fmt)
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(prog='python -m opt_prob')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    p = commands.add_parser('serve', help='serve evaluations over a socket')
+    p.add_argument('--host', default='127.0.0.1')
+    p.add_argument('--port', type=int, default=8765)
+    p.add_argument('--unix', default=None, help='Unix socket path, instead of TCP')
+    p.add_argument('--window', type=float, default=0.001,
+                   help='seconds a request waits for others to join its batch')
+    p.add_argument('--max-batch', type=int, default=4096)
+    p.add_argument('--max-bytes', type=int, default=256*2**20,
+                   help='largest accepted request, in bytes of points')
+    p.set_defaults(func=serve)
+
+    p = commands.add_parser('eval', help='evaluate points read from a file or stdin')
+    p.add_argument('name', help='name in Cons.names or NonCons.names')
+    p.add_argument('--in', dest='input', default='-', help='.npy or .csv file, - for stdin')
+    p.add_argument('--out', dest='output', default='-', help='.npy or .csv file, - for stdout')
+    p.add_argument('--format', choices=['csv', 'npy'], default=None,
+                   help='input format, from the file extension by default, csv for stdin')
+    p.add_argument('--out-format', choices=['csv', 'npy'], default=None,
+                   help='output format, from the file extension by default, csv for stdout')
+    p.add_argument('--cns', action='store_true', help='evaluate cns instead of obj')
+    p.add_argument('--chunk', type=int, default=65536, help='points evaluated at a time')
+    p.add_argument('--workers', type=int, default=1, help='worker processes')
+    p.add_argument('--dtype', choices=['float64', 'float32'], default='float64',
+                   help='float type of the evaluation and of the output')
+    p.set_defaults(func=evaluate)
+
+    args = parser.parse_args(argv)
+    try:
+        args.func(args)
+    except ValueError as e:
+        parser.exit(1, '{}: error: {}\n'.format(parser.prog, e))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+asyncio evaluation of the problems, used through Problem.aobj, acns,
+aobj_batch and acns_batch.
+
+Evaluations run in an executor: the default thread pool of the event loop,
+a given ThreadPoolExecutor, or a ProcessPoolExecutor. Problem functions are
+closures and cannot be pickled, so a process pool rebuilds the problem from
+its class, name, dimensions and dtype, once per worker process.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .base import Wrapper
+
+_problems = {}
+
+
+def _evaluate(cls, name, dimensions, dtype, method, x):
+
+    """ evaluate in a worker process, building the problem once """
+
+    key = (cls, name, dimensions, dtype)
+    if key not in _problems:
+        _problems[key] = cls(name, dimensions, dtype)
+    return getattr(_problems[key], method)(x)
+
+
+def _task(problem, method, executor):
+
+    """ function of x that runs `method` of the problem in the executor """
+
+    if isinstance(executor, ProcessPoolExecutor):
+        if isinstance(problem, Wrapper):
+            raise ValueError("Only Cons and NonCons problems can be sent to a process pool.")
+        return functools.partial(_evaluate, type(problem), problem.name, problem.dimensions,
+                                 problem.dtype.name, method)
+    return getattr(problem, method)
+
+
+def run(problem, method, x, executor=None):
+
+    """
+    Descriptions:
+        Run one method of a problem in an executor, from a coroutine of
+        the running event loop
+    Args:
+        problem (Cons or NonCons): problem
+        method (str): 'obj', 'cns', 'obj_batch' or 'cns_batch'
+        x: argument of the method
+        executor (Executor): None for the default executor of the loop
+    Returns:
+        asyncio.Future: result of the method
+    """
+
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(executor, _task(problem, method, executor), x)
+
+
+async def gather(problem, X, method='obj_batch', limit=8, chunk=1, executor=None):
+
+    """
+    Descriptions:
+        Evaluate many points, with at most `limit` evaluations submitted to
+        the executor at once. Points are sent `chunk` rows at a time.
+    Args:
+        problem (Cons or NonCons): problem
+        X (np.ndarray): points, shape (n, dimensions)
+        method (str): 'obj_batch' or 'cns_batch'
+        limit (int): maximum number of evaluations in flight
+        chunk (int): number of points per evaluation
+        executor (Executor): None for the default executor of the loop
+    Returns:
+        np.ndarray: values in the order of X
+    """
+
+    X = np.asarray(X, dtype=float)
+    if X.shape[0] == 0:
+        return getattr(problem, method)(X)
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def evaluate(rows):
+        async with semaphore:
+            return await run(problem, method, rows, executor)
+
+    parts = await asyncio.gather(*[evaluate(X[i:i+chunk]) for i in range(0, X.shape[0], chunk)])
+    return np.concatenate(parts)
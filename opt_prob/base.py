@@ -0,0 +1,575 @@
+"""
+Base classes of the problem collections and problem wrappers.
+"""
+
+import threading
+import tracemalloc
+import warnings
+
+import numpy as np
+
+from .util import with_fallback
+
+
+class Problem(object):
+
+    """
+    Descriptions:
+        Evaluation helpers shared by Cons, NonCons and the problem wrappers
+    """
+
+    __slots__ = ('_batchable', '_batch_bytes', '_local', '_optima')
+
+    dtype = np.dtype(np.float64) # float type of the batch evaluations
+    cache_bytes = 2**20 # working set of one chunk of a batch call
+    max_bytes = 512*2**20 # cap on the working set of one chunk, below cache_bytes it lowers it
+    kdtree_optima = 16 # number of known solutions above which a KD-tree is used
+
+    def obj_batch(self, X, out=None, max_bytes=None):
+
+        """
+        Descriptions:
+            Evaluate obj at many points, chunk by chunk on X.T if obj
+            broadcasts (see batchable and chunks), else one point at a time
+        Args:
+            X (np.ndarray): points, shape (n, dimensions)
+            out (np.ndarray): optional array receiving the values
+            max_bytes (int): cap on the bytes of one chunk, self.max_bytes by default
+        Returns:
+            np.ndarray: obj values, shape (n,), of type self.dtype
+        """
+
+        X = np.asarray(X)
+        if out is None:
+            out = np.empty(X.shape[0], dtype=self.dtype)
+        obj = self.obj
+        if self.batchable('obj'):
+            for i, j in self.chunks('obj', X.shape[0], max_bytes):
+                out[i:j] = _lift(obj, self.workspace(X[i:j])).reshape(j - i)
+            return out
+        for i, x in enumerate(X.tolist()):
+            out[i] = obj(x)
+        return out
+
+    def cns_batch(self, X, out=None, max_bytes=None):
+
+        """
+        Descriptions:
+            Evaluate cns at many points, chunk by chunk on X.T if cns
+            broadcasts (see batchable and chunks), else one point at a time
+        Args:
+            X (np.ndarray): points, shape (n, dimensions)
+            out (np.ndarray): optional array receiving the values
+            max_bytes (int): cap on the bytes of one chunk, self.max_bytes by default
+        Returns:
+            np.ndarray: cns values, shape (n, number of cns), of type self.dtype
+        """
+
+        X = np.asarray(X)
+        if self.cns is None:
+            return np.empty((X.shape[0], 0), dtype=self.dtype) if out is None else out
+        cns = self.cns
+        if self.batchable('cns'):
+            for i, j in self.chunks('cns', X.shape[0], max_bytes):
+                G = _lift(cns, self.workspace(X[i:j])).reshape(-1, j - i).T
+                if out is None:
+                    out = np.empty((X.shape[0], G.shape[1]), dtype=self.dtype)
+                out[i:j] = G
+            return np.empty((0, 0), dtype=self.dtype) if out is None else out
+        G = np.array([cns(x) for x in X.tolist()], dtype=self.dtype).reshape(X.shape[0], -1)
+        return _into(G, out)
+
+    def chunks(self, func, n, max_bytes=None):
+
+        """
+        Descriptions:
+            Row ranges of a batch call of obj or cns on n points. A chunk
+            holds as many points as fit in min(cache_bytes, max_bytes),
+            counting the workspace and the intermediates of func per point
+            (see batch_bytes), so that large batches neither run out of
+            cache nor out of memory. max_bytes only caps the chunks: a value
+            above cache_bytes has no effect, raise cache_bytes for larger
+            chunks.
+        Args:
+            func (str): 'obj' or 'cns'
+            n (int): number of points
+            max_bytes (int): cap on the bytes of one chunk, self.max_bytes by default
+        Returns:
+            List[tuple]: (start, stop) of each chunk
+        """
+
+        budget = min(self.cache_bytes, self.max_bytes if max_bytes is None else max_bytes)
+        rows = max(1, int(budget//self.batch_bytes(func)))
+        return [(i, min(i + rows, n)) for i in range(0, n, rows)]
+
+    def batch_bytes(self, func='obj'):
+
+        """
+        Descriptions:
+            Bytes per point of a lifted call of obj or cns: the workspace and
+            the peak of the intermediates, measured once with tracemalloc on
+            a sample of the box. When tracemalloc is already in use, e.g. by
+            the caller, it is left alone and the intermediates are taken as
+            8 arrays per point instead.
+        Args:
+            func (str): 'obj' or 'cns'
+        Returns:
+            float: bytes per point
+        """
+
+        try:
+            measured = self._batch_bytes
+        except AttributeError:
+            measured = self._batch_bytes = {}
+        if func not in measured:
+            d = len(self.lb)
+            size = self.dtype.itemsize
+            measured[func] = size*d + _peak_bytes(getattr(self, func), self.lb, self.ub, self.dtype)
+        return measured[func]
+
+    def workspace(self, X):
+
+        """
+        Descriptions:
+            X.T copied into a contiguous (dimensions, n) scratch array of type
+            self.dtype, which makes the ufuncs of a lifted call run on
+            contiguous rows. The buffer is kept per thread and reused while
+            it is large enough.
+        Args:
+            X (np.ndarray): points, shape (n, dimensions)
+        Returns:
+            np.ndarray: X.T, shape (dimensions, n)
+        """
+
+        try:
+            local = self._local
+        except AttributeError:
+            local = self._local = threading.local()
+        buf = getattr(local, 'workspace', None)
+        if buf is None or buf.size < X.size or buf.dtype != self.dtype:
+            buf = local.workspace = np.empty(X.size, dtype=self.dtype)
+        W = buf[:X.size].reshape(X.shape[::-1])
+        np.copyto(W, X.T)
+        return W
+
+    def batchable(self, func='obj'):
+
+        """
+        Descriptions:
+            Check whether obj or cns broadcasts over stacked points, i.e.
+            func(X.T) with X.T of shape (dimensions, n) gives the values of
+            the n points. Most functions do, because they index x[0], x[1],
+            ... and a non-list point is evaluated with NumPy (see lib_of).
+            The lifted call is compared with the single point path on a
+            sample of the box, once per problem, on first use. A lifted
+            call that returns a wider float than self.dtype, e.g. float64
+            from a float32 workspace because of a np.float64 constant,
+            raises a RuntimeWarning.
+        Args:
+            func (str): 'obj' or 'cns'
+        Returns:
+            bool: True if func can be called on X.T
+        """
+
+        try:
+            checked = self._batchable
+        except AttributeError:
+            checked = self._batchable = {}
+        if func not in checked:
+            f = getattr(self, func)
+            checked[func] = _broadcasts(f, self.lb, self.ub)
+            wide = checked[func] and _result_dtype(f, self.lb, self.ub, self.dtype)
+            if wide and wide != self.dtype:
+                warnings.warn("{} of {} returns {} on {} points.".format(
+                    func, self.name, wide, self.dtype), RuntimeWarning)
+        return checked[func]
+
+    def distance_to_optima(self, X):
+
+        """
+        Descriptions:
+            Euclidean distance of many points, e.g. the final points of many
+            runs, to their nearest known solution in xopt. Above
+            kdtree_optima solutions the nearest one is found with a
+            scipy.spatial.cKDTree, built once, when scipy is installed.
+        Args:
+            X (np.ndarray): points, shape (n, dimensions)
+        Returns:
+            np.ndarray: distances, shape (n,)
+        """
+
+        xopt = np.asarray(self.xopt, dtype=float)
+        if len(xopt) == 0:
+            raise ValueError("Problem without known solution.")
+        X = np.asarray(X, dtype=float).reshape(-1, xopt.shape[1])
+
+        if len(xopt) > self.kdtree_optima:
+            try:
+                optima, tree = self._optima
+            except AttributeError:
+                optima = tree = None
+            if optima is not self.xopt:
+                try:
+                    from scipy.spatial import cKDTree
+                    tree = cKDTree(xopt)
+                except ImportError:
+                    tree = None
+                self._optima = (self.xopt, tree)
+            if tree is not None:
+                return tree.query(X)[0]
+
+        D2 = np.full(X.shape[0], np.inf)
+        for xk in xopt:
+            R = X - xk
+            np.minimum(D2, np.einsum('ij,ij->i', R, R), out=D2)
+        return np.sqrt(D2)
+
+    def reached_target(self, F, tol=1e-4, G=None, cns_tol=0.0):
+
+        """
+        Descriptions:
+            Whether obj values reach the known optimum, F <= fopt + tol, for
+            many runs at once. Given the cns values G of the same points, a
+            run also has to end feasible, G <= cns_tol (see is_feasible).
+        Args:
+            F (np.ndarray): obj values, shape (n,)
+            tol (float): absolute tolerance on obj
+            G (np.ndarray): cns values, shape (n, number of cns), or None
+            cns_tol (float): allowed violation
+        Returns:
+            np.ndarray: bool, shape (n,)
+        """
+
+        if self.fopt is None:
+            raise ValueError("Problem without known optimum.")
+        F = np.asarray(F, dtype=float).reshape(-1)
+        reached = F <= self.fopt + tol
+        if G is not None:
+            G = np.asarray(G, dtype=float).reshape(F.shape[0], -1)
+            reached &= np.all(G <= cns_tol, axis=1) # nan counts as violated
+        return reached
+
+    def bound(self, lo, hi, func='obj'):
+
+        """
+        Descriptions:
+            Lower and upper bounds of obj or of each cns over the boxes
+            lo <= x <= hi, many boxes at once, by interval evaluation of the
+            problem's formulas (see interval). The bounds hold on the whole
+            box but are usually not tight, and tighten as the box shrinks,
+            which is what branch-and-bound and DIRECT-style solvers need to
+            discard boxes without evaluating them.
+        Args:
+            lo (np.ndarray): lower corners, shape (n, dimensions)
+            hi (np.ndarray): upper corners, shape (n, dimensions)
+            func (str): 'obj' or 'cns'
+        Returns:
+            L (np.ndarray): lower bounds, shape (n,) for obj, (n, number of cns) for cns
+            U (np.ndarray): upper bounds, same shape as L
+        """
+
+        from . import interval
+
+        lo = np.atleast_2d(np.asarray(lo, dtype=float))
+        hi = np.atleast_2d(np.asarray(hi, dtype=float))
+        box = interval.Interval(lo.T, hi.T)
+        if func == 'obj':
+            funcs = [self.obj]
+        else:
+            funcs = [] if self.cns is None else self.cns_funcs
+
+        L = np.empty((lo.shape[0], len(funcs)))
+        U = np.empty((lo.shape[0], len(funcs)))
+        for k, f in enumerate(funcs):
+            try:
+                with np.errstate(all='ignore'):
+                    y = interval.as_interval(f(box))
+            except (TypeError, ValueError): # branches on x, or converts x to an array
+                raise ValueError("{} of {} cannot be evaluated on intervals.".format(func, self.name))
+            L[:, k] = y.lo
+            U[:, k] = y.hi
+        if func == 'obj':
+            return L[:, 0], U[:, 0]
+        return L, U
+
+    def lipschitz(self, samples=1024, seed=0):
+
+        """
+        Descriptions:
+            Lipschitz constants of obj and of each cns over the box, for
+            Lipschitz-based global solvers. Linear cns get their exact
+            constant. The others get the largest gradient norm found at
+            `samples` random points of the box, an estimate from below that
+            solvers usually multiply by a safety factor. The constants of a
+            Cons or NonCons problem are computed once per (name, dimensions)
+            and kept in memory, and in a JSON file if lipschitz.path is set.
+        Args:
+            samples (int): number of sampled points
+            seed (int): seed of the sample
+        Returns:
+            L (float): constant of obj
+            L_cns (np.ndarray): constants of the cns, shape (number of cns,)
+        """
+
+        from . import lipschitz
+        return lipschitz.constants(self, samples, seed)
+
+    def aobj(self, x, executor=None):
+
+        """
+        Descriptions:
+            Evaluate obj in an executor, `await problem.aobj(x)`
+        Args:
+            x (List[float]): point
+            executor (Executor): thread or process pool, None for the
+                default executor of the event loop
+        Returns:
+            asyncio.Future: obj value
+        """
+
+        from . import aio
+        return aio.run(self, 'obj', x, executor)
+
+    def acns(self, x, executor=None):
+
+        """ cns counterpart of aobj, `await problem.acns(x)` """
+
+        from . import aio
+        return aio.run(self, 'cns', x, executor)
+
+    def aobj_batch(self, X, limit=8, chunk=1, executor=None):
+
+        """
+        Descriptions:
+            Evaluate obj at many points in an executor, with at most `limit`
+            evaluations in flight, `await problem.aobj_batch(X)`
+        Args:
+            X (np.ndarray): points, shape (n, dimensions)
+            limit (int): maximum number of evaluations in flight
+            chunk (int): number of points per evaluation
+            executor (Executor): thread or process pool, None for the
+                default executor of the event loop
+        Returns:
+            coroutine: obj values, shape (n,)
+        """
+
+        from . import aio
+        return aio.gather(self, X, 'obj_batch', limit, chunk, executor)
+
+    def acns_batch(self, X, limit=8, chunk=1, executor=None):
+
+        """ cns counterpart of aobj_batch, values of shape (n, number of cns) """
+
+        from . import aio
+        return aio.gather(self, X, 'cns_batch', limit, chunk, executor)
+
+    def __str__(self):
+        string = ''
+        for line in self.__doc__.split('\n'):
+            string += line.lstrip() + '\n'
+        return string
+
+
+class Collection(Problem):
+
+    """
+    Descriptions:
+        Base of the problem collections Cons and NonCons. Problems are
+        slotted and built once per (name, dimensions, dtype): building the
+        same problem again returns the shared instance, so treat it as
+        read-only. lb and ub are read-only arrays of shape (dimensions,),
+        xopt a read-only array of shape (k, dimensions) with every known
+        solution, k = 0 when none is known.
+    Args:
+        name (str): problem's name
+        dimensions (int): dimensions of a scalable problem
+        dtype (np.dtype): float type of the batch evaluations
+    """
+
+    __slots__ = ('name', 'dimensions', 'dtype', 'obj', 'cns', 'delta',
+                 'lb', 'ub', 'xopt', 'fopt', 'structure', 'doc')
+
+    def __init_subclass__(cls, **kwargs):
+        super(Collection, cls).__init_subclass__(**kwargs)
+        cls.__doc__ = _Doc(cls.__doc__)
+        cls._instances = {}
+
+    def __new__(cls, name, dimensions=2, dtype=np.float64):
+
+        key = (name, dimensions, np.dtype(dtype))
+        problem = cls._instances.get(key)
+        if problem is None:
+            problem = Problem.__new__(cls)
+            problem._build(name, dimensions, dtype)
+            problem.add_fallback()
+            problem.freeze()
+            problem = cls._instances.setdefault(key, problem)
+        return problem
+
+    def __init__(self, name, dimensions=2, dtype=np.float64):
+        pass # built once, in __new__
+
+    def add_fallback(self):
+
+        """ evaluate list points with NumPy where `math` raises, see util.with_fallback """
+
+        self.obj = with_fallback(self.obj)
+        if self.cns is not None:
+            self.cns = with_fallback(self.cns)
+
+    def freeze(self):
+
+        """ make the array attributes read-only arrays, xopt of shape (k, dimensions) """
+
+        self.lb = _frozen(self.lb)
+        self.ub = _frozen(self.ub)
+        xopt = np.zeros((0, len(self.lb))) if self.xopt is None else np.atleast_2d(self.xopt)
+        if xopt.shape[1] != len(self.lb): # known in the default dimensions only
+            xopt = np.zeros((0, len(self.lb)))
+        self.xopt = _frozen(xopt)
+
+
+class _Doc(object):
+
+    """
+    __doc__ of the slotted problems: the class docstring on the class, the
+    problem's description, kept in the doc slot, on an instance
+    """
+
+    def __init__(self, doc):
+        self.doc = doc
+
+    def __get__(self, problem, cls=None):
+        return self.doc if problem is None else problem.doc
+
+    def __set__(self, problem, doc):
+        problem.doc = doc
+
+
+class Wrapper(Problem):
+
+    """
+    Descriptions:
+        Base of the problem wrappers. A wrapper starts as a copy of the
+        wrapped problem's attributes and overrides what it transforms.
+    Args:
+        problem (Cons or NonCons): problem to wrap
+    Attributes:
+        problem (Cons or NonCons): wrapped problem
+    """
+
+    def __init__(self, problem):
+
+        self.problem = problem
+        self.name = problem.name
+        self.dimensions = problem.dimensions
+        self.obj = problem.obj
+        self.cns = problem.cns
+        self.delta = problem.delta
+        self.lb = problem.lb
+        self.ub = problem.ub
+        self.xopt = problem.xopt
+        self.fopt = problem.fopt
+        self.structure = problem.structure
+        self.__doc__ = problem.__doc__
+
+    def obj_batch(self, X, out=None, max_bytes=None):
+        if self.obj is self.problem.obj:
+            return self.problem.obj_batch(X, out, max_bytes)
+        return Problem.obj_batch(self, X, out, max_bytes)
+
+    def cns_batch(self, X, out=None, max_bytes=None):
+        if self.cns is self.problem.cns:
+            return self.problem.cns_batch(X, out, max_bytes)
+        return Problem.cns_batch(self, X, out, max_bytes)
+
+    def bound(self, lo, hi, func='obj'):
+        if getattr(self, func) is getattr(self.problem, func):
+            return self.problem.bound(lo, hi, func)
+        return Problem.bound(self, lo, hi, func)
+
+
+def _frozen(a):
+
+    """ read-only float array copy of a """
+
+    a = np.array(a, dtype=float)
+    a.flags.writeable = False
+    return a
+
+
+def _lift(f, XT):
+
+    """ f evaluated on stacked points XT, shape (dimensions, n), as a float array """
+
+    Y = np.asarray(f(XT), dtype=XT.dtype)
+    if np.may_share_memory(Y, XT): # e.g. obj(x) = x[0], a view of the workspace
+        Y = Y.copy()
+    return Y
+
+
+def _into(Y, out):
+
+    """ Y, written into out if given """
+
+    if out is None:
+        return Y
+    out[...] = Y
+    return out
+
+
+def _broadcasts(f, lb, ub, samples=8):
+
+    """ whether f(X.T) matches [f(x) for x in X] on a sample of the box """
+
+    lb = np.asarray(lb, dtype=float)
+    ub = np.asarray(ub, dtype=float)
+    X = lb + (ub - lb)*np.random.RandomState(0).uniform(size=(samples, lb.size))
+
+    with np.errstate(all='ignore'):
+        try:
+            single = np.array([f(x) for x in X.tolist()], dtype=float).reshape(samples, -1)
+            lifted = _lift(f, X.T)
+        except Exception:
+            return False
+    if lifted.size != single.size:
+        return False
+    lifted = lifted.reshape(-1, samples).T
+    return bool(np.allclose(lifted, single, rtol=1e-10, atol=1e-12, equal_nan=True))
+
+
+def _result_dtype(f, lb, ub, dtype, samples=8):
+
+    """ dtype of f on stacked points of the box of type dtype """
+
+    lb = np.asarray(lb, dtype=float)
+    ub = np.asarray(ub, dtype=float)
+    X = lb + (ub - lb)*np.random.RandomState(0).uniform(size=(samples, lb.size))
+    with np.errstate(all='ignore'):
+        return np.asarray(f(np.ascontiguousarray(X.T, dtype=dtype))).dtype
+
+
+_tracing = threading.Lock() # one tracemalloc measure at a time
+
+
+def _peak_bytes(f, lb, ub, dtype, samples=1024):
+
+    """ peak bytes per point allocated by f on stacked points of the box """
+
+    lb = np.asarray(lb, dtype=float)
+    ub = np.asarray(ub, dtype=float)
+    X = lb + (ub - lb)*np.random.RandomState(0).uniform(size=(samples, lb.size))
+    XT = np.ascontiguousarray(X.T, dtype=dtype)
+
+    with _tracing:
+        if tracemalloc.is_tracing(): # not ours, do not reset or stop it
+            return 8.0*dtype.itemsize
+        tracemalloc.start()
+        try:
+            with np.errstate(all='ignore'):
+                start = tracemalloc.get_traced_memory()[0]
+                f(XT)
+                peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return max(8.0, float(peak - start)/samples)
@@ -0,0 +1,154 @@
+"""
+Catalog of the problem collections:
+dimensions, category, modality, number of cns, bounds and fopt of every
+problem, queryable without building or evaluating any problem.
+
+The table is written down from cons.py and non_cons.py. Values are those of
+the problem built with its default dimensions, e.g. NonCons(name), scalable
+problems can be built with other dimensions.
+"""
+
+# -- name: (collection, dimensions, scalable, category, multimodal, number of cns, lb, ub, fopt)
+#    category is the one of the Virtual Library of Simulation Experiments for
+#    NonCons ('many local minima', 'bowl', 'plate', 'valley', 'steep',
+#    'other') and 'constrained' for Cons. multimodal is None when unknown.
+
+_FIELDS = ('collection', 'dimensions', 'scalable', 'category', 'multimodal', 'cns', 'lb', 'ub', 'fopt')
+
+_CATALOG = {
+    # Cons
+    "1.4 G4 Problem": ('Cons', 5, False, 'constrained', None, 6, [78, 33, 27, 27, 27], [102, 45, 45, 45, 45], -30665.539),
+    "1.6 G6 Problem": ('Cons', 2, False, 'constrained', None, 2, [13, 0], [100, 100], -6961.81388),
+    "1.7 G7 Problem": ('Cons', 10, False, 'constrained', None, 8, [-10.0, -10.0, -10.0, -10.0, -10.0, -10.0, -10.0, -10.0, -10.0, -10.0], [10.0, 10.0, 10.0, 10.0, 10.0, 10.0, 10.0, 10.0, 10.0, 10.0], 24.3062091),
+    "1.8 G8 Problem": ('Cons', 2, False, 'constrained', True, 2, [0, 0], [10, 10], -0.095825),
+    "1.9 G9 Problem": ('Cons', 7, False, 'constrained', None, 4, [-10.0, -10.0, -10.0, -10.0, -10.0, -10.0, -10.0], [10.0, 10.0, 10.0, 10.0, 10.0, 10.0, 10.0], 680.6300573),
+    "1.10 G10 Problem": ('Cons', 8, False, 'constrained', None, 6, [100, 1000, 1000, 10, 10, 10, 10, 10], [10000, 10000, 10000, 1000, 1000, 1000, 1000, 1000], 7049.3307),
+    "2.1 ALKYLATION": ('Cons', 7, False, 'constrained', None, 14, [0, 0, 0, 0, 90, 0.01, 145], [2000, 16000, 120, 5000, 95, 4, 162], -1768.75),
+    "2.2 CAMEL": ('Cons', 2, False, 'constrained', True, 1, [-3, -1.5], [3, 1.5], 0.29861),
+    "2.3 FUNC2D": ('Cons', 2, False, 'constrained', None, 1, [0, 0], [5, 5], -1.1743),
+    "2.4 GOLDPR": ('Cons', 2, False, 'constrained', True, 2, [-2, -2], [2, 2], 5.6694),
+    "2.5 GOMEZ": ('Cons', 2, False, 'constrained', True, 1, [-1, -1], [1, 1], -0.9711),
+    "2.6 HS23": ('Cons', 2, False, 'constrained', None, 5, [-50, -50], [50, 50], 2.0),
+    "2.8 KS224": ('Cons', 2, False, 'constrained', None, 4, [0, 0], [6, 6], -304.0),
+    "2.9 KS250": ('Cons', 3, False, 'constrained', None, 2, [0, 0, 0], [20, 11, 42], -3300.0),
+    "2.10 KS346": ('Cons', 3, False, 'constrained', None, 2, [0, 0, 0], [36, 5, 125], -5.68478),
+    "2.11 NEWBRANIN": ('Cons', 2, False, 'constrained', True, 1, [-5, 0], [10, 15], -268.789),
+    "2.12 PRES": ('Cons', 2, False, 'constrained', None, 3, [0, 0], [10, 10], 5.1766),
+    # NonCons
+    "1.1 Ackley Function": ('NonCons', 2, True, 'many local minima', True, 0, [-39.0, -39.0], [40.0, 40.0], 0.0),
+    "1.2 Bukin Function N. 6": ('NonCons', 2, False, 'many local minima', True, 0, [-15, -3], [-5, 3], 0.0),
+    "1.3 Cross-in-Tray Function": ('NonCons', 2, False, 'many local minima', True, 0, [-10, -10], [10, 10], -2.06261),
+    "1.4 Drop-Wave Function": ('NonCons', 2, False, 'many local minima', True, 0, [-1.9, -1.9], [2, 2], -1.0),
+    "1.5 Eggholder Function": ('NonCons', 2, False, 'many local minima', True, 0, [-600, -600], [600, 600], -959.6407),
+    "1.6 Gramacy and Lee (2012) Function": ('NonCons', 1, False, 'many local minima', True, 0, [0.5], [2.5], -0.8690111349647177),
+    "1.7 Griewank Function": ('NonCons', 2, True, 'many local minima', True, 0, [-9.0, -9.0], [10.0, 10.0], 0.0),
+    "1.8 Holder Table Function": ('NonCons', 2, False, 'many local minima', True, 0, [-10, -10], [10, 10], -19.2085),
+    "1.10 Levy Function": ('NonCons', 2, False, 'many local minima', True, 0, [-9, -9], [10, 10], 0.0),
+    "1.11 Levy Function N. 13": ('NonCons', 2, False, 'many local minima', True, 0, [-10, -10], [10, 10], 0.0),
+    "1.12 Rastrigin Function": ('NonCons', 2, True, 'many local minima', True, 0, [-4.0, -4.0], [5.0, 5.0], 0.0),
+    "1.13 Schaffer Function N. 2": ('NonCons', 2, False, 'many local minima', True, 0, [-4, -4], [5, 5], 0.0),
+    "1.14 Schaffer Function N. 4": ('NonCons', 2, False, 'many local minima', True, 0, [-50, -50], [50, 50], 0.0),
+    "1.15 Schwefel Function": ('NonCons', 2, True, 'many local minima', True, 0, [-500.0, -500.0], [500.0, 500.0], 0),
+    "1.16 Shubert Function": ('NonCons', 2, False, 'many local minima', True, 0, [-10, -10], [10, 10], -186.7309),
+    "2.1 Bohachevsky Function": ('NonCons', 2, False, 'bowl', False, 0, [-99.0, -99.0], [100.0, 100.0], 0.0),
+    "2.2 Perm Function": ('NonCons', 2, True, 'bowl', False, 0, [-2.0, -2.0], [2.0, 2.0], 0.0),
+    "2.3 Rotated Hyper-Ellipsoid Function": ('NonCons', 2, True, 'bowl', False, 0, [-59.0, -59.0], [60.0, 60.0], 0.0),
+    "2.4 Sphere Function Modified": ('NonCons', 6, False, 'bowl', False, 0, [-0.9, -0.9, -0.9, -0.9, -0.9, -0.9], [1.0, 1.0, 1.0, 1.0, 1.0, 1.0], 0.0),
+    "2.5 Sum of Different Powers Function": ('NonCons', 2, True, 'bowl', False, 0, [-0.9, -0.9], [1.0, 1.0], 0.0),
+    "2.6 Sum Squares Function": ('NonCons', 2, True, 'bowl', False, 0, [-9.0, -9.0], [10.0, 10.0], 0.0),
+    "2.7 Trid Function": ('NonCons', 2, True, 'bowl', False, 0, [-3.6, -3.6], [4.0, 4.0], -2.0),
+    "3.1 Booth Function": ('NonCons', 2, False, 'plate', False, 0, [-10.0, -10.0], [10.0, 10.0], 0.0),
+    "3.2 Matyas Function": ('NonCons', 2, False, 'plate', False, 0, [-9.0, -9.0], [10.0, 10.0], 0.0),
+    "3.3 McCormick Function": ('NonCons', 2, False, 'plate', False, 0, [-1.5, -3.0], [4.0, 4.0], -1.9133),
+    "3.5 Zakharov Function": ('NonCons', 2, True, 'plate', False, 0, [-5.0, -5.0], [10.0, 10.0], 0.0),
+    "4.1 Three-Hump Camel Function": ('NonCons', 2, False, 'valley', True, 0, [-4.0, -4.0], [5.0, 5.0], 0.0),
+    "4.2 Six-Hump Camel Function": ('NonCons', 2, False, 'valley', True, 0, [-3, -2], [3, 2], -1.0316),
+    "4.3 Dixon-Price Function": ('NonCons', 2, True, 'valley', False, 0, [-9.0, -9.0], [10.0, 10.0], 0.0),
+    "4.4 Rosenbrock Function": ('NonCons', 2, True, 'valley', False, 0, [-5.0, -5.0], [10.0, 10.0], 0.0),
+    "5.2 Easom Function": ('NonCons', 2, False, 'steep', False, 0, [-100.0, -100.0], [100.0, 100.0], -1.0),
+    "5.3 Michalewicz Function": ('NonCons', 2, True, 'steep', True, 0, [0.0, 0.0], [3.141592653589793, 3.141592653589793], -1.8013),
+    "6.1 Beale Function": ('NonCons', 2, False, 'other', True, 0, [-4.5, -4.5], [4.5, 4.5], 0.0),
+    "6.2 Branin Function": ('NonCons', 2, False, 'other', True, 0, [-5, 0], [10, 15], 0.3979),
+    "6.3 Colville Function": ('NonCons', 4, False, 'other', False, 0, [-9.0, -9.0, -9.0, -9.0], [10.0, 10.0, 10.0, 10.0], 0.0),
+    "6.4 Forrester et al. (2008) Function": ('NonCons', 1, False, 'other', True, 0, [0], [1], -6.0207400551464705),
+    "6.5 Goldstein-Price Function": ('NonCons', 2, False, 'other', True, 0, [-2, -2], [2, 2], 3.0),
+    "6.6 Hartmann 3-D Function": ('NonCons', 3, False, 'other', True, 0, [0, 0, 0], [1, 1, 1], -3.8628),
+    "6.7 Hartmann 4-D Function": ('NonCons', 4, False, 'other', True, 0, [0.0, 0.0, 0.0, 0.0], [1.0, 1.0, 1.0, 1.0], -3.1335),
+    "6.8 Hartmann 6-D Function": ('NonCons', 6, False, 'other', True, 0, [0.0, 0.0, 0.0, 0.0, 0.0, 0.0], [1.0, 1.0, 1.0, 1.0, 1.0, 1.0], -3.3224),
+    "6.9 Perm Function": ('NonCons', 2, True, 'other', False, 0, [-2.0, -2.0], [2.0, 2.0], 0.0),
+    "6.11 Shekel Function 5": ('NonCons', 4, False, 'other', True, 0, [0, 0, 0, 0], [10, 10, 10, 10], -10.1532),
+    "6.12 Shekel Function 7": ('NonCons', 4, False, 'other', True, 0, [0, 0, 0, 0], [10, 10, 10, 10], -10.4029),
+    "6.13 Shekel Function 10": ('NonCons', 4, False, 'other', True, 0, [0, 0, 0, 0], [10, 10, 10, 10], -10.5364),
+    "6.14 Styblinski-Tang Function": ('NonCons', 2, True, 'other', True, 0, [-5.0, -5.0], [5.0, 5.0], -78.33198),
+    }
+
+
+def info(name):
+
+    """
+    Descriptions:
+        Catalog entry of a problem
+    Args:
+        name (str): problem's name
+    Returns:
+        dict:
+            name (str): problem's name
+            collection (str): 'Cons' or 'NonCons'
+            dimensions (int): number of variables with the default dimensions
+            scalable (bool): True if the problem takes any dimensions
+            category (str): shape of the problem
+            multimodal (bool): True if there are several local minima, None if unknown
+            cns (int): number of cns outputs
+            lb (List[float]): lower bound of variables
+            ub (List[float]): upper bound of variables
+            fopt (float): solution's obj value
+    """
+
+    if name not in _CATALOG:
+        raise ValueError("Unkown problem name.")
+    entry = dict(zip(_FIELDS, _CATALOG[name]))
+    entry['name'] = name
+    entry['lb'] = list(entry['lb'])
+    entry['ub'] = list(entry['ub'])
+    return entry
+
+
+def select(collection=None, dimensions=None, category=None, multimodal=None,
+           min_cns=None, max_cns=None, scalable=None):
+
+    """
+    Descriptions:
+        Names of the problems matching every given filter, in the order of
+        Cons.names then NonCons.names, e.g. all 2-D multimodal problems with
+        at least 2 cns: select(dimensions=2, multimodal=True, min_cns=2)
+    Args:
+        collection (str): 'Cons' or 'NonCons'
+        dimensions (int): number of variables, scalable problems match any
+        category (str): shape of the problem, see info
+        multimodal (bool): True for problems with several local minima
+        min_cns (int): minimum number of cns outputs
+        max_cns (int): maximum number of cns outputs
+        scalable (bool): True for problems taking any dimensions
+    Returns:
+        List[str]: problem names
+    """
+
+    names = []
+    for name, entry in _CATALOG.items():
+        c, d, s, cat, mm, m = entry[:6]
+        if collection is not None and c != collection:
+            continue
+        if dimensions is not None and d != dimensions and not s:
+            continue
+        if category is not None and cat != category:
+            continue
+        if multimodal is not None and mm is not multimodal:
+            continue
+        if min_cns is not None and m < min_cns:
+            continue
+        if max_cns is not None and m > max_cns:
+            continue
+        if scalable is not None and s != scalable:
+            continue
+        names.append(name)
+    return names
@@ -2,25 +2,46 @@
 Constrained Optimization Problem Collections:
 """
 
+import threading
+
 import numpy as np
 
+from .base import Collection
+from .structure import structure_of
+from .util import lib_of, with_fallback
+
 
-class Cons:
+class Cons(Collection):
 
     """
     Descriptions:
         Constrained optimization problem
     Args:
         name (str): problem's name
+        dimensions (int): dimensions of a scalable problem
+        dtype (np.dtype): float type of obj_batch and cns_batch, np.float32
+            for single precision, single points are always float64
     Attributes:
+        name (str): problem's name
+        dimensions (int): dimensions argument the problem was built with
+        dtype (np.dtype): float type of the batch evaluations
         obj (func): obj function
-        cns (func): cns function
-        lb (List[float]): lower bound of variables
-        ub (List[float]): upper bound of variables
-        xopt (List[float]): solution's variables
+        cns (func): cns function, returns the 1-D array of all cns outputs
+        cns_funcs (List[func]): one function per cns output, cns_funcs[k](x) = cns(x)[k]
+        delta (None): incremental obj update, not supported for constrained problems
+        lb (np.ndarray): lower bound of variables, read-only
+        ub (np.ndarray): upper bound of variables, read-only
+        xopt (np.ndarray): known solutions, shape (k, dimensions), read-only
         fopt (float): solution's obj value
+        structure (dict): separability and variable interactions, see structure_of
+        lin (List[int]): indices of the cns outputs that are linear
+        nonlin (List[int]): indices of the remaining cns outputs
+        A (np.ndarray): linear cns as A*x <= b, one row per index in lin
+        b (np.ndarray): right hand side of the linear cns
     """
 
+    __slots__ = ('cns_funcs', 'lin', 'nonlin', 'A', 'b')
+
     names = [
         "1.4 G4 Problem",
         "1.6 G6 Problem",
@@ -41,7 +62,12 @@ class Cons:
         "2.12 PRES"
         ]
 
-    def __init__(self, name, dimensions=2):
+    def _build(self, name, dimensions, dtype):
+
+        self.delta = None
+        self.lin = []
+        self.A = []
+        self.b = []
 
         if name == '1.4 G4 Problem':
             
@@ -55,20 +81,35 @@ class Cons:
                 y = 5.3578547*x[2]**2+0.8356891*x[0]*x[4]+37.293239*x[0]-40792.141
                 return y
 
+            # -- the intermediates are written once, each cns_funcs[k]
+            #    computes only the one it needs
+
+            def u(x):
+                return 85.334407+0.0056858*x[1]*x[4]+0.0006262*x[0]*x[3]-0.0022053*x[2]*x[4]
+
+            def v(x):
+                return 80.51249+0.0071317*x[1]*x[4]+0.0029955*x[0]*x[1]+0.0021813*x[2]**2
+
+            def w(x):
+                return 9.300961+0.0047026*x[2]*x[4]+0.0012547*x[0]*x[2]+0.0019085*x[2]*x[3]
+
+            cns_funcs = [
+                lambda x: -u(x),
+                lambda x: u(x)-92,
+                lambda x: -v(x)+90,
+                lambda x: v(x)-110,
+                lambda x: -w(x)+20,
+                lambda x: w(x)-25]
+
             def cns(x):
-                u = 85.334407+0.0056858*x[1]*x[4]+0.0006262*x[0]*x[3]-0.0022053*x[2]*x[4]
-                g1 = -u
-                g2 = u-92
-                v = 80.51249+0.0071317*x[1]*x[4]+0.0029955*x[0]*x[1]+0.0021813*x[2]**2
-                g3 = -v+90
-                g4 = v-110
-                w = 9.300961+0.0047026*x[2]*x[4]+0.0012547*x[0]*x[2]+0.0019085*x[2]*x[3]
-                g5 = -w+20
-                g6 = w-25
-                return [g1, g2, g3, g4, g5, g6]
+                a = u(x)
+                b = v(x)
+                c = w(x)
+                return [-a, a-92, -b+90, b-110, -c+20, c-25]
             
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
             self.lb = [78,33,27,27,27]
             self.ub = [102,45,45,45,45]
             self.xopt = [78,33,29.995,45,36.7758]
@@ -86,13 +127,18 @@ class Cons:
                 y = (x[0]-10.0)**3+(x[1]-20.0)**3
                 return y
 
+            cns_funcs = [
+                lambda x: -(x[0]-5)**2-(x[1]-5)**2+100,
+                lambda x: (x[0]-6)**2+(x[1]-5)**2-82.81]
+
+            g1, g2 = cns_funcs
+
             def cns(x):
-                g1 = -(x[0]-5)**2-(x[1]-5)**2+100
-                g2 = (x[0]-6)**2+(x[1]-5)**2-82.81
-                return [g1, g2]
+                return [g1(x), g2(x)]
             
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
             self.lb = [13, 0]
             self.ub = [100, 100]
             self.xopt = [14.095,0.84296]
@@ -112,19 +158,30 @@ class Cons:
                     7*(x[7]-11)**2+2*(x[8]-10)**2+(x[9]-7)**2+45
                 return y
 
+            cns_funcs = [
+                lambda x: 4*x[0]+5*x[1]-3*x[6]+9*x[7]-105,
+                lambda x: 10*x[0]-8*x[1]-17*x[6]+2*x[7],
+                lambda x: -8*x[0]+2*x[1]+5*x[8]-2*x[9]-12,
+                lambda x: 3*(x[0]-2)**2+4*(x[1]-3)**2+2*x[2]**2-7*x[3]-120,
+                lambda x: 5*x[0]**2+8*x[1]+(x[2]-6)**2-2*x[3]-40,
+                lambda x: 0.5*(x[0]-8)**2+2*(x[1]-4)**2+3*x[4]**2-x[5]-30,
+                lambda x: x[0]**2+2*(x[1]-2)**2-2*x[0]*x[1]+14*x[4]-6*x[5],
+                lambda x: -3*x[0]+6*x[1]+12*(x[8]-8)**2-7*x[9]]
+
+            g1, g2, g3, g4, g5, g6, g7, g8 = cns_funcs
+
             def cns(x):
-                g1 = 4*x[0]+5*x[1]-3*x[6]+9*x[7]-105
-                g2 = 10*x[0]-8*x[1]-17*x[6]+2*x[7]
-                g3 = -8*x[0]+2*x[1]+5*x[8]-2*x[9]-12
-                g4 = 3*(x[0]-2)**2+4*(x[1]-3)**2+2*x[2]**2-7*x[3]-120
-                g5 = 5*x[0]**2+8*x[1]+(x[2]-6)**2-2*x[3]-40
-                g6 = 0.5*(x[0]-8)**2+2*(x[1]-4)**2+3*x[4]**2-x[5]-30
-                g7 = x[0]**2+2*(x[1]-2)**2-2*x[0]*x[1]+14*x[4]-6*x[5]
-                g8 = -3*x[0]+6*x[1]+12*(x[8]-8)**2-7*x[9]
-                return [g1, g2, g3, g4, g5, g6, g7, g8]
+                return [g1(x), g2(x), g3(x), g4(x), g5(x), g6(x), g7(x), g8(x)]
             
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
+            self.lin = [0, 1, 2]
+            self.A = [
+                [4, 5, 0, 0, 0, 0, -3, 9, 0, 0],
+                [10, -8, 0, 0, 0, 0, -17, 2, 0, 0],
+                [-8, 2, 0, 0, 0, 0, 0, 0, 5, -2]]
+            self.b = [105, 0, 12]
             self.lb = (np.ones(10)*-10.0).tolist()
             self.ub = (np.ones(10)*10.0).tolist()
             self.xopt = [2.171996, 2.363683, 8.773926, 5.095984, 0.9906548, 1.430574,1.321644, 9.828726, 8.280092, 8.375927]
@@ -139,16 +196,22 @@ class Cons:
             """
 
             def obj(x):
-                y = -(np.sin(2*np.pi*x[0])**3*np.sin(2*np.pi*x[1]))/(x[0]**3*(x[0]+x[1]))
+                lib = lib_of(x)
+                y = -(lib.sin(2*np.pi*x[0])**3*lib.sin(2*np.pi*x[1]))/(x[0]**3*(x[0]+x[1]))
                 return y
 
+            cns_funcs = [
+                lambda x: x[0]**2-x[1]+1,
+                lambda x: 1-x[0]+(x[1]-4)**2]
+
+            g1, g2 = cns_funcs
+
             def cns(x):
-                g1 = x[0]**2-x[1]+1
-                g2 = 1-x[0]+(x[1]-4)**2
-                return [g1, g2]
+                return [g1(x), g2(x)]
             
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
             self.lb = [0, 0]
             self.ub = [10, 10]
             self.xopt = [1.2279713, 4.2453733]
@@ -167,17 +230,20 @@ class Cons:
                     10*x[4]**6+7*x[5]**2+x[6]**4-4*x[5]*x[6]-10*x[5]-8*x[6]
                 return y
 
+            cns_funcs = [
+                lambda x: 2*x[0]**2+3*x[1]**4+x[2]+4*x[3]**2+5*x[4]-127,
+                lambda x: 7*x[0]+3*x[1]+10*x[2]**2+x[3]-x[4]-282,
+                lambda x: 23*x[0]+x[1]**2+6*x[5]**2-8*x[6]-196,
+                lambda x: 4*x[0]**2+x[1]**2-3*x[0]*x[1]+2*x[2]**2+5*x[5]-11*x[6]]
+
+            g1, g2, g3, g4 = cns_funcs
+
             def cns(x):
-                v1 = 2*x[0]**2;
-                v2 = x[1]**2;
-                g1 = v1+3*v2**2+x[2]+4*x[3]**2+5*x[4]-127;
-                g2 = 7*x[0]+3*x[1]+10*x[2]**2+x[3]-x[4]-282;
-                g3 = 23*x[0]+v2+6*x[5]**2-8*x[6]-196;
-                g4 = 2*v1+v2-3*x[0]*x[1]+2*x[2]**2+5*x[5]-11*x[6];
-                return [g1, g2, g3, g4]
+                return [g1(x), g2(x), g3(x), g4(x)]
             
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
             self.lb = (np.ones(7)*-10.0).tolist()
             self.ub = (np.ones(7)*10.0).tolist()
             self.xopt = [2.330499, 1.951372, -0.4775414, 4.365726, -0.6244870, 1.038131, 1.594227]
@@ -195,17 +261,28 @@ class Cons:
                 y = x[0]+x[1]+x[2]
                 return y
 
+            cns_funcs = [
+                lambda x: -1+0.0025*(x[3]+x[5]),
+                lambda x: -1+0.0025*(-x[3]+x[4]+x[6]),
+                lambda x: -1+0.01*(-x[4]+x[7]),
+                lambda x: 100*x[0]-x[0]*x[5]+833.33252*x[3]-83333.333,
+                lambda x: x[1]*x[3]-x[1]*x[6]-1250*x[3]+1250*x[4],
+                lambda x: x[2]*x[4]-x[2]*x[7]-2500*x[4]+1250000]
+
+            g1, g2, g3, g4, g5, g6 = cns_funcs
+
             def cns(x):
-                g1 = -1+0.0025*(x[3]+x[5])
-                g2 = -1+0.0025*(-x[3]+x[4]+x[6])
-                g3 = -1+0.01*(-x[4]+x[7])
-                g4 = 100*x[0]-x[0]*x[5]+833.33252*x[3]-83333.333
-                g5 = x[1]*x[3]-x[1]*x[6]-1250*x[3]+1250*x[4]
-                g6 = x[2]*x[4]-x[2]*x[7]-2500*x[4]+1250000
-                return [g1, g2, g3, g4, g5, g6]
+                return [g1(x), g2(x), g3(x), g4(x), g5(x), g6(x)]
             
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
+            self.lin = [0, 1, 2]
+            self.A = [
+                [0, 0, 0, 0.0025, 0, 0.0025, 0, 0],
+                [0, 0, 0, -0.0025, 0.0025, 0, 0.0025, 0],
+                [0, 0, 0, 0, -0.01, 0, 0, 0.01]]
+            self.b = [1, 1, 1]
             self.lb = [100, 1000, 1000, 10, 10, 10, 10, 10]
             self.ub = [10000, 10000, 10000, 1000, 1000, 1000, 1000, 1000]
             self.xopt = [579.3167, 1359.943, 5110.071, 182.0174, 295.5985, 217.9799, 286.4162, 395.5979]
@@ -229,36 +306,70 @@ class Cons:
                 f = -(0.063*X4*X5 - 5.04*X1 - 0.035*X2 - 10.0*X3 - 3.36*x5)
                 return f
 
+            # -- the intermediates are written once, each cns_funcs[k]
+            #    computes only the ones it needs
+
+            def x5_of(x):
+                return 1.22*x[3] - x[0]
+
+            def x6_of(x):
+                return (98000*x[2])/(x[3]*x[5] + 1000.0*x[2])
+
+            def x8_of(x, x5):
+                return (x[1] + x5)/x[0]
+
+            def p1_of(x, x8):
+                return x[0]*(1.12 + 0.13167*x8 - 0.00667*x8**2)
+
+            def p3_of(x6, x8):
+                return 86.35 + 1.098*x8 - 0.038*x8**2 + 0.325*(x6 - 89.0)
+
+            cns_funcs = [
+                lambda x: 0.99*x[3] - p1_of(x, x8_of(x, x5_of(x))),
+                lambda x: p1_of(x, x8_of(x, x5_of(x))) - (100.0/99.0)*x[3],
+                lambda x: 0.99*x[4] - p3_of(x6_of(x), x8_of(x, x5_of(x))),
+                lambda x: p3_of(x6_of(x), x8_of(x, x5_of(x))) - (100.0/99.0)*x[4],
+                lambda x: 0.9*x[5] - (35.82 - 0.222*x[6]),
+                lambda x: (35.82 - 0.222*x[6]) - (10.0/9.0)*x[5],
+                lambda x: 0.99*x[6] - (-133 + 3*x[4]),
+                lambda x: (-133 + 3.0*x[4]) - (100.0/99.0)*x[6],
+                lambda x: x5_of(x) - 2000,
+                lambda x: -x5_of(x),
+                lambda x: x6_of(x) - 93.0,
+                lambda x: 85.0 - x6_of(x),
+                lambda x: x8_of(x, x5_of(x)) - 12.0,
+                lambda x: 3.0 - x8_of(x, x5_of(x))]
+
             def cns(x):
-                X1 = x[0]
-                X2 = x[1]
-                X3 = x[2]
                 X4 = x[3]
                 X5 = x[4]
                 X6 = x[5]
                 X7 = x[6]
-                x5 = 1.22*X4 - X1
-                x6 = (98000*X3)/(X4*X6 + 1000.0*X3)
-                x8 = (X2 + x5)/X1
-
-                g1 = 0.99*X4 - (X1*(1.12 + 0.13167*x8 - 0.00667*x8**2))
-                g2 = (X1*(1.12 + 0.13167*x8 - 0.00667*x8**2)) - (100.0/99.0)*X4
-                g3 = 0.99*X5 - (86.35 + 1.098*x8 - 0.038*x8**2 + 0.325*(x6 - 89.0))
-                g4 = (86.35 + 1.098*x8 - 0.038*x8**2 + 0.325*(x6-89.0)) - (100.0/99.0)*X5
-                g5 = 0.9*X6 - (35.82 - 0.222*X7)
-                g6 = (35.82 - 0.222*X7) - (10.0/9.0)*X6
-                g7 = 0.99*X7-(-133+3*X5)
-                g8 = (-133 + 3.0*X5) - (100.0/99.0)*X7
-                g9 = x5 - 2000
-                g10 = -x5
-                g11 = x6 - 93.0
-                g12 = 85.0 - x6
-                g13 = x8 - 12.0
-                g14 = 3.0 - x8
-                return [g1, g2, g3, g4, g5, g6, g7, g8, g9, g10, g11, g12, g13, g14]
+                x5 = x5_of(x)
+                x6 = x6_of(x)
+                x8 = x8_of(x, x5)
+                p1 = p1_of(x, x8)
+                p3 = p3_of(x6, x8)
+                g5 = 35.82 - 0.222*X7
+                g7 = -133 + 3.0*X5
+                return [0.99*X4 - p1, p1 - (100.0/99.0)*X4,
+                        0.99*X5 - p3, p3 - (100.0/99.0)*X5,
+                        0.9*X6 - g5, g5 - (10.0/9.0)*X6,
+                        0.99*X7 - g7, g7 - (100.0/99.0)*X7,
+                        x5 - 2000, -x5, x6 - 93.0, 85.0 - x6, x8 - 12.0, 3.0 - x8]
 
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
+            self.lin = [4, 5, 6, 7, 8, 9]
+            self.A = [
+                [0, 0, 0, 0, 0, 0.9, 0.222],
+                [0, 0, 0, 0, 0, -10.0/9.0, -0.222],
+                [0, 0, 0, 0, -3.0, 0, 0.99],
+                [0, 0, 0, 0, 3.0, 0, -100.0/99.0],
+                [-1, 0, 0, 1.22, 0, 0, 0],
+                [1, 0, 0, -1.22, 0, 0, 0]]
+            self.b = [35.82, -35.82, -133, 133, 2000, 0]
             self.lb = [0, 0, 0, 0, 90, 0.01, 145]
             self.ub = [2000, 16000, 120, 5000, 95, 4, 162]
             self.xopt = [1698.1, 15819, 54.107, 3031.2, 95.000, 1.5618, 153.54]
@@ -285,8 +396,11 @@ class Cons:
                 g = (3.0-x[0])**2 + (1-x[1])**2 - 3.0
                 return g
 
+            cns_funcs = [cns]
+
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
             self.lb = [-3, -1.5]
             self.ub = [ 3,  1.5]
             self.xopt = [1.7476, 0.8738]
@@ -301,15 +415,20 @@ class Cons:
             """
 
             def obj(x):
-                f = 2 + 0.01*(x[1]-x[0]**2)**2 + (1-x[0])**2 + 2*(2-x[1])**2 + 7*np.sin(0.5*x[0])*np.sin(0.7*x[1]*x[0])
+                lib = lib_of(x)
+                f = 2 + 0.01*(x[1]-x[0]**2)**2 + (1-x[0])**2 + 2*(2-x[1])**2 + 7*lib.sin(0.5*x[0])*lib.sin(0.7*x[1]*x[0])
                 return f
 
             def cns(x):
-                g = -np.sin(x[0] - x[1] - np.pi/8.0)
+                lib = lib_of(x)
+                g = -lib.sin(x[0] - x[1] - np.pi/8.0)
                 return g
 
+            cns_funcs = [cns]
+
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
             self.lb = [0, 0]
             self.ub = [5, 5]
             self.xopt = [2.7450, 2.3523]
@@ -329,19 +448,28 @@ class Cons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 g1 = 19.0 - 14.0*x[0] + 3.0*x[0]**2 - 14.0*x[1] + 6.0*x[0]*x[1] + 3.0*x[1]**2
                 g2 = 18.0 - 32.0*x[0] + 12.0*x[0]**2 + 48.0*x[1] - 36.0*x[0]*x[1] + 27.0*x[1]**2
                 f = (1.0+((x[0]+x[1]+1.0)**2)*g1)*(30.0+((2.0*x[0]-3.0*x[1])**2)*g2)
-                f = np.log(f)
+                f = lib.log(f)
                 return f
 
+            cns_funcs = [
+                lambda x: -(3.0*x[0]) + (-3.0*x[1])**3,
+                lambda x: x[0] - x[1] - 1.0]
+
+            g1, g2 = cns_funcs
+
             def cns(x):
-                g1 = -(3.0*x[0]) + (-3.0*x[1])**3
-                g2 = x[0] - x[1] - 1.0
-                return [g1, g2]
+                return [g1(x), g2(x)]
 
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
+            self.lin = [1]
+            self.A = [[1.0, -1.0]]
+            self.b = [1.0]
             self.lb = [-2, -2]
             self.ub = [2, 2]
             self.xopt = [0.5955, -0.4045]
@@ -360,11 +488,15 @@ class Cons:
                 return f
 
             def cns(x):
-                g = -np.sin(4*np.pi*x[0]) + 2*(np.sin(2*np.pi*x[1])**2)
+                lib = lib_of(x)
+                g = -lib.sin(4*np.pi*x[0]) + 2*(lib.sin(2*np.pi*x[1])**2)
                 return g
 
+            cns_funcs = [cns]
+
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
             self.lb = [-1, -1]
             self.ub = [ 1,  1]
             self.xopt = [0.10925714458181, -0.62344776471809]
@@ -382,16 +514,24 @@ class Cons:
                 f = x[0]**2 + x[1]**2
                 return f
 
+            cns_funcs = [
+                lambda x: -x[0] - x[1] + 1.0,
+                lambda x: -x[0]**2 - x[1]**2 + 1.0,
+                lambda x: -9.0*x[0]**2 - x[1]**2 + 9.0,
+                lambda x: -x[0]**2 + x[1],
+                lambda x: -x[1]**2 + x[0]]
+
+            g1, g2, g3, g4, g5 = cns_funcs
+
             def cns(x):
-                g1 = -x[0] - x[1] + 1.0
-                g2 = -x[0]**2 - x[1]**2 + 1.0
-                g3 = -9.0*x[0]**2 - x[1]**2 + 9.0
-                g4 = -x[0]**2 + x[1]
-                g5 = -x[1]**2 + x[0]
-                return [g1, g2, g3, g4, g5]
+                return [g1(x), g2(x), g3(x), g4(x), g5(x)]
 
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
+            self.lin = [0]
+            self.A = [[-1.0, -1.0]]
+            self.b = [-1.0]
             self.lb = [-50, -50]
             self.ub = [50, 50]
             self.xopt = [1.0, 1.0]
@@ -411,15 +551,27 @@ class Cons:
                 f = 2.0*x[0]**2 + x[1]**2 - 48.0*x[0] - 40.0*x[1]
                 return f
 
+            cns_funcs = [
+                lambda x: -1.0*(x[0] + 3.0*x[1]),
+                lambda x: -1.0*(18.0 - x[0] - 3*x[1]),
+                lambda x: -1.0*(x[0] + x[1]),
+                lambda x: -1.0*(8.0 - x[0] - x[1])]
+
+            g1, g2, g3, g4 = cns_funcs
+
             def cns(x):
-                g1 = -1.0*(x[0] + 3.0*x[1])
-                g2 = -1.0*(18.0 - x[0] - 3*x[1])
-                g3 = -1.0*(x[0] + x[1])
-                g4 = -1.0*(8.0 - x[0] - x[1])
-                return [g1, g2, g3, g4]
+                return [g1(x), g2(x), g3(x), g4(x)]
 
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
+            self.lin = [0, 1, 2, 3]
+            self.A = [
+                [-1.0, -3.0],
+                [1.0, 3.0],
+                [-1.0, -1.0],
+                [1.0, 1.0]]
+            self.b = [0.0, 18.0, 0.0, 8.0]
             self.lb = [0, 0]
             self.ub = [6, 6]
             self.xopt = [4.0, 4.0]
@@ -439,13 +591,23 @@ class Cons:
                 f = -x[0]*x[1]*x[2]
                 return f
 
+            cns_funcs = [
+                lambda x: - x[0] - 2*x[1] - 2*x[2],
+                lambda x: x[0] + 2*x[1] + 2*x[2] - 72.0]
+
+            g1, g2 = cns_funcs
+
             def cns(x):
-                g1 = - x[0] - 2*x[1] - 2*x[2]
-                g2 = x[0] + 2*x[1] + 2*x[2] - 72.0
-                return [g1, g2]
+                return [g1(x), g2(x)]
 
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
+            self.lin = [0, 1]
+            self.A = [
+                [-1.0, -2.0, -2.0],
+                [1.0, 2.0, 2.0]]
+            self.b = [0.0, 72.0]
             self.lb = [0, 0, 0]
             self.ub = [20, 11, 42]
             self.xopt = [20.0, 11.0, 15.0]
@@ -465,13 +627,18 @@ class Cons:
                 f = -(0.0201/1e7)*(x[0]**4)*x[1]*(x[2]**2)
                 return f
 
+            cns_funcs = [
+                lambda x: (x[0]**2)*x[1] - 675.0,
+                lambda x: (x[0]**2)*(x[2]**2)/1e7 - 0.419]
+
+            g1, g2 = cns_funcs
+
             def cns(x):
-                g1 = (x[0]**2)*x[1] - 675.0
-                g2 = (x[0]**2)*(x[2]**2)/1e7 - 0.419
-                return [g1, g2]
+                return [g1(x), g2(x)]
 
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
             self.lb = [0, 0, 0]
             self.ub = [36, 5, 125]
             self.xopt = [16.51, 2.477, 124]
@@ -493,19 +660,24 @@ class Cons:
                 f = -(x[0]-10.0)**2 - (x[1]-15.0)**2
                 return f
 
+            a = 1.0
+            b = 5.1/(4.0*(np.pi**2))
+            c = 5.0/np.pi
+            d = 6.0
+            e = 10.0
+            f = 1.0/(8.0*np.pi)
+
             def cns(x):
-                a = 1.0
-                b = 5.1/(4.0*(np.pi**2))
-                c = 5.0/np.pi
-                d = 6.0
-                e = 10.0
-                f = 1.0/(8.0*np.pi)
-                branin = a*(x[1] - b*x[0]**2 + c*x[0] - d)**2 + e*(1-f)*np.cos(x[0]) + e
+                lib = lib_of(x)
+                branin = a*(x[1] - b*x[0]**2 + c*x[0] - d)**2 + e*(1-f)*lib.cos(x[0]) + e
                 g = branin - 5.0
                 return g
 
+            cns_funcs = [cns]
+
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
             self.lb = [-5, 0]
             self.ub = [10, 15]
             self.xopt = [3.2730, 0.0489]
@@ -523,14 +695,19 @@ class Cons:
                 f = x[0] + x[1]
                 return f
 
+            cns_funcs = [
+                lambda x: 20.0 - (x[0]**2)*x[1],
+                lambda x: x[0]**2 + 8.0*x[1] - 75.0,
+                lambda x: 1.0 - ((x[0] + x[1] - 5.0)**2)/30.0 - ((x[0] - x[1] - 12.0)**2)/120.0]
+
+            g1, g2, g3 = cns_funcs
+
             def cns(x):
-                g1 = 20.0 - (x[0]**2)*x[1]
-                g2 = x[0]**2 + 8.0*x[1] - 75.0
-                g3 = 1.0 - ((x[0] + x[1] - 5.0)**2)/30.0 - ((x[0] - x[1] - 12.0)**2)/120.0
-                return [g1, g2, g3]
+                return [g1(x), g2(x), g3(x)]
 
             self.obj = obj
             self.cns = cns
+            self.cns_funcs = cns_funcs
             self.lb = [0, 0]
             self.ub = [10, 10]
             self.xopt = [3.1139, 2.0627]
@@ -539,8 +716,337 @@ class Cons:
         else:
             raise "Unkown problem name."
 
-    def __str__(self):
-        string = ''
-        for line in self.__doc__.split('\n'):
-            string += line.lstrip() + '\n'
-        return string
+        self.name = name
+        self.dimensions = dimensions
+        self.dtype = np.dtype(dtype)
+        self.structure = structure_of(name, dimensions)
+
+        # -- cns as a 1-D array of all cns outputs, (number of cns, n) on
+        #    stacked points
+
+        g = self.cns
+        if len(self.cns_funcs) == 1:
+            self.cns = lambda x: np.array([g(x)])
+        else:
+            self.cns = lambda x: np.array(g(x))
+
+        n = self.structure['dimensions']
+        self.A = np.array(self.A, dtype=float).reshape(-1, n)
+        self.b = np.array(self.b, dtype=float)
+        self.nonlin = [k for k in range(len(self.cns_funcs)) if k not in self.lin]
+
+    def add_fallback(self):
+        Collection.add_fallback(self)
+        self.cns_funcs = [with_fallback(g) for g in self.cns_funcs]
+
+    def freeze(self):
+        Collection.freeze(self)
+        self.A.flags.writeable = False
+        self.b.flags.writeable = False
+
+    def linear(self, sparse=False):
+
+        """
+        Descriptions:
+            Linear cns in A*x <= b form, they are the cns outputs listed in lin
+        Args:
+            sparse (bool): return A as a scipy.sparse.csr_matrix
+        Returns:
+            A (np.ndarray): coefficient matrix, shape (len(lin), dimensions)
+            b (np.ndarray): right hand side, shape (len(lin),)
+        """
+
+        if sparse:
+            import scipy.sparse
+            return scipy.sparse.csr_matrix(self.A), self.b
+        return self.A, self.b
+
+    def cns_lin(self, x):
+
+        """
+        Descriptions:
+            Evaluate the linear cns, A*x - b, for one point or a batch of points
+        Args:
+            x (np.ndarray): point, shape (dimensions,), or points, shape (n, dimensions)
+        Returns:
+            np.ndarray: linear cns values, shape (len(lin),) or (n, len(lin))
+        """
+
+        return np.dot(x, self.A.T) - self.b
+
+    def cns_nonlin(self, x):
+
+        """
+        Descriptions:
+            Evaluate only the cns outputs listed in nonlin
+        Args:
+            x (List[float]): point
+        Returns:
+            np.ndarray: nonlinear cns values
+        """
+
+        cns_funcs = self.cns_funcs
+        return np.array([cns_funcs[k](x) for k in self.nonlin])
+
+    def cns_batch(self, X, out=None, max_bytes=None):
+
+        """
+        Descriptions:
+            Evaluate cns at many points, one call of cns per chunk of stacked
+            points (see chunks), so intermediates shared by several cns are
+            computed once
+        Args:
+            X (np.ndarray): points, shape (n, dimensions)
+            out (np.ndarray): optional array receiving the values
+            max_bytes (int): cap on the bytes of one chunk, self.max_bytes by default
+        Returns:
+            np.ndarray: cns values, shape (n, number of cns)
+        """
+
+        X = np.asarray(X)
+        m = len(self.cns_funcs)
+        G = np.empty((X.shape[0], m), dtype=self.dtype) if out is None else out
+        cns = self.cns
+        for i, j in self.chunks('cns', X.shape[0], max_bytes):
+            G[i:j] = cns(self.workspace(X[i:j])).T
+        return G
+
+    def violation(self, x):
+
+        """
+        Descriptions:
+            Total cns violation, sum(max(g, 0))
+        Args:
+            x (List[float]): point
+        Returns:
+            float: total violation, 0 for a feasible point
+        """
+
+        return np.maximum(self.cns(x), 0.0).sum(axis=0) # nan stays nan
+
+    def violation_batch(self, X, power=1, out=None):
+
+        """
+        Descriptions:
+            Total cns violation of many points, sum(max(g, 0)**power)
+        Args:
+            X (np.ndarray): points, shape (n, dimensions)
+            power (float): exponent applied to each violation
+            out (np.ndarray): optional array receiving the violations
+        Returns:
+            np.ndarray: total violations, shape (n,)
+        """
+
+        G = self.cns_batch(X)
+        np.maximum(G, 0.0, out=G)
+        if power != 1:
+            G **= power
+        return G.sum(axis=1, out=out)
+
+    def is_feasible(self, x, tol=0.0):
+
+        """
+        Descriptions:
+            Check cns(x) <= tol one constraint at a time, most often violated
+            first, and stop at the first violated one. The order is learned
+            by a FeasibilityChecker kept per thread (see checker).
+        Args:
+            x (List[float]): point
+            tol (float): allowed violation
+        Returns:
+            bool: True if every cns is satisfied
+        """
+
+        return self.checker().is_feasible(x, tol)
+
+    def is_feasible_batch(self, X, tol=0.0):
+
+        """ is_feasible of many points, see FeasibilityChecker.is_feasible_batch """
+
+        return self.checker().is_feasible_batch(X, tol)
+
+    def checker(self):
+
+        """
+        Descriptions:
+            FeasibilityChecker of the calling thread, used by is_feasible and
+            is_feasible_batch. The problem is shared, so each thread learns
+            its own cns order.
+        Returns:
+            FeasibilityChecker: checker of the calling thread
+        """
+
+        try:
+            local = self._local
+        except AttributeError:
+            local = self._local = threading.local()
+        checker = getattr(local, 'checker', None)
+        if checker is None:
+            checker = local.checker = FeasibilityChecker(self)
+        return checker
+
+    def jac_sparsity(self):
+
+        """
+        Descriptions:
+            Sparsity pattern of the cns Jacobian in COO form, usable as
+            scipy.sparse.coo_matrix((np.ones(len(row)), (row, col)), shape=shape)
+        Returns:
+            row (np.ndarray): cns index of each nonzero
+            col (np.ndarray): variable index of each nonzero
+            shape (tuple): (number of cns, number of variables)
+        """
+
+        cns_vars = self.structure['cns_vars']
+        row = []
+        col = []
+        for k, vars_k in enumerate(cns_vars):
+            row.extend([k]*len(vars_k))
+            col.extend(vars_k)
+        shape = (len(cns_vars), self.structure['dimensions'])
+        return np.array(row, dtype=int), np.array(col, dtype=int), shape
+
+    def jac_groups(self):
+
+        """
+        Descriptions:
+            Group the variables so that no two variables in a group appear
+            in the same cns. A whole group can be perturbed at once when
+            finite differencing the Jacobian, which takes one cns evaluation
+            per group instead of one per variable. The format matches the
+            `sparsity=(structure, groups)` argument of scipy's finite
+            difference helpers.
+        Returns:
+            np.ndarray: group number of each variable
+        """
+
+        cns_vars = self.structure['cns_vars']
+        n = self.structure['dimensions']
+
+        # -- greedy coloring of the column intersection graph
+
+        rows_of = [set() for _ in range(n)]
+        for k, vars_k in enumerate(cns_vars):
+            for i in vars_k:
+                rows_of[i].add(k)
+
+        groups = np.zeros(n, dtype=int)
+        group_rows = []
+        for i in sorted(range(n), key=lambda i: -len(rows_of[i])):
+            for gi, rows in enumerate(group_rows):
+                if not rows & rows_of[i]:
+                    rows |= rows_of[i]
+                    groups[i] = gi
+                    break
+            else:
+                groups[i] = len(group_rows)
+                group_rows.append(set(rows_of[i]))
+        return groups
+
+
+class FeasibilityChecker(object):
+
+    """
+    Descriptions:
+        Feasibility checks of a Cons problem that evaluate the cns one at a
+        time, most often violated first, and stop at the first violation.
+        The order is learned from the points checked so far. Problems are
+        shared by everyone who builds them (see Collection), so this state
+        lives in the checker, not in the problem: give each solver or
+        thread its own checker.
+    Args:
+        problem (Cons): problem to check
+    Attributes:
+        problem (Cons): problem
+        order (List[int]): order in which the cns are checked, linear ones
+            first until the violation counts say otherwise
+        violations (List[float]): violation count of each cns, halved at
+            every update of order
+        checks (int): number of points checked
+    """
+
+    reorder_every = 64 # feasibility checks between two updates of order
+
+    def __init__(self, problem):
+
+        self.problem = problem
+        self.order = problem.lin + problem.nonlin
+        self.violations = [0.0]*len(problem.cns_funcs)
+        self.checks = 0
+
+    def is_feasible(self, x, tol=0.0):
+
+        """
+        Descriptions:
+            Check cns(x) <= tol one constraint at a time in order and stop
+            at the first violated one
+        Args:
+            x (List[float]): point
+            tol (float): allowed violation
+        Returns:
+            bool: True if every cns is satisfied
+        """
+
+        cns_funcs = self.problem.cns_funcs
+        feasible = True
+        for k in self.order:
+            if not cns_funcs[k](x) <= tol: # nan counts as violated
+                self.violations[k] += 1
+                feasible = False
+                break
+
+        self.checks += 1
+        if self.checks % self.reorder_every == 0:
+            self.update_order()
+        return feasible
+
+    def is_feasible_batch(self, X, tol=0.0):
+
+        """
+        Descriptions:
+            Feasibility of many points. The cns are evaluated one at a time in
+            order, vectorized over the points still feasible, so a point is
+            dropped as soon as one cns rejects it.
+        Args:
+            X (np.ndarray): points, shape (n, dimensions)
+            tol (float): allowed violation
+        Returns:
+            np.ndarray: feasibility mask, shape (n,)
+        """
+
+        problem = self.problem
+        X = np.asarray(X, dtype=float)
+        alive = np.arange(X.shape[0])
+        rows = dict(zip(problem.lin, range(len(problem.lin))))
+
+        for k in self.order:
+            if alive.size == 0:
+                break
+            Xa = X[alive]
+            if k in rows:
+                r = rows[k]
+                g = np.dot(Xa, problem.A[r]) - problem.b[r]
+            else:
+                g = problem.cns_funcs[k](Xa.T)
+            violated = ~(g <= tol)
+            self.violations[k] += np.count_nonzero(violated)
+            alive = alive[~violated]
+
+        feasible = np.zeros(X.shape[0], dtype=bool)
+        feasible[alive] = True
+
+        self.checks += X.shape[0]
+        self.update_order()
+        return feasible
+
+    def update_order(self):
+
+        """
+        Descriptions:
+            Sort order by violation count, most violated first, and halve
+            the counts so that recent points weigh more than old ones
+        """
+
+        violations = self.violations
+        self.order = sorted(self.order, key=lambda k: -violations[k])
+        self.violations = [v*0.5 for v in violations]
@@ -9,22 +9,14 @@ def plot(problem):
 
     lb = problem.lb
     ub = problem.ub
-    obj = problem.obj
     cns = problem.cns
     xopt = problem.xopt
     fopt = problem.fopt
 
     # -- verification
 
-    try:
-        print('obj(xopt) = {}'.format(obj(xopt)))
-    except:
-        print('obj(xopt) = {}'.format(obj(xopt[0])))
-
-    try:
-        print('xopt = {}'.format(xopt))
-    except:
-        print('xopt = {}'.format(xopt[0]))
+    print('obj(xopt) = {}'.format(problem.obj_batch(xopt)))
+    print('xopt = {}'.format(xopt))
 
     # -- plot
 
@@ -34,8 +26,7 @@ def plot(problem):
 
         num = 100
         x_plot = np.linspace(lb, ub, num)
-        fs = [obj(x) for x in x_plot]
-        f_plot = np.array(fs).reshape(num)
+        f_plot = problem.obj_batch(x_plot)
 
         plt.figure()
         plt.plot(x_plot, f_plot)
@@ -51,13 +42,10 @@ def plot(problem):
         x2 = np.linspace(lb[1], ub[1], num)
         x1_plot, x2_plot = np.meshgrid(x1, x2)
         xs = np.hstack((x1_plot.reshape(-1,1), x2_plot.reshape(-1,1)))
-        fs = [obj(x) for x in xs]
-        f_plot = np.array(fs).reshape(num, num)
+        f_plot = problem.obj_batch(xs).reshape(num, num)
 
         if cns is not None:
-            gs = [cns(x) for x in xs]
-            dim = len(gs[0]) if isinstance(gs[0], list) else 1
-            g_plot = np.array(gs).reshape(num, num, dim)
+            g_plot = problem.cns_batch(xs).reshape(num, num, -1)
 
         plt.figure() # figsize=(12.80, 10.24)
         plt.xlabel('$x_1$')
@@ -67,14 +55,10 @@ def plot(problem):
         plt.colorbar()
 
         if cns is not None:
-            for i in range(dim):
+            for i in range(g_plot.shape[2]):
                 plt.contour(x1_plot, x2_plot, g_plot[:,:,i], colors="k", levels=0, linestyles='dotted', lw=0.1)
 
-        if isinstance(xopt[0], list):
-            for xopt_i in xopt:
-                plt.plot(xopt_i[0], xopt_i[1], '*r')
-        else:
-            plt.plot(xopt[0], xopt[1], '*r')
+        plt.plot(xopt[:,0], xopt[:,1], '*r', linestyle='none')
 
         plt.axis( [ lb[0], ub[0], lb[1], ub[1] ] )
         plt.axis('equal')
@@ -84,14 +68,10 @@ def plot(problem):
         # -- 3d surface
 
         fig = plt.figure()
-        ax = fig.gca(projection='3d')
+        ax = fig.add_subplot(111, projection='3d')
         surf = ax.plot_surface(x1_plot, x2_plot, f_plot, cmap=cm.jet, linewidth=0, antialiased=False, alpha=0.4)
-        if isinstance(xopt[0], list):
-            for xopt_i in xopt:
-                ax.scatter(xopt_i[0], xopt_i[1], obj(xopt_i), color="r", marker='*', s=50)
-        else:
-            ax.scatter(xopt[0], xopt[1], obj(xopt), color="r", marker='*', s=50)
-        
+        ax.scatter(xopt[:,0], xopt[:,1], problem.obj_batch(xopt), color="r", marker='*', s=50)
+
         ax.set_xlabel('$x_1$')
         ax.set_ylabel('$x_2$')
         ax.set_zlabel('$f$')
@@ -0,0 +1,199 @@
+"""
+Interval arithmetic on NumPy arrays, used through Problem.bound.
+
+An Interval holds arrays of lower and upper ends, so one evaluation bounds
+a function over many boxes at once. lib_of returns this module for an
+Interval, so the formulas of the problems run unchanged on boxes: x[i] is
+the range of variable i over each box, and lib.sin, lib.cos, lib.exp,
+lib.log and lib.sqrt are the interval functions below. Every result is
+rounded outward by a few ulps, which covers the rounding of the NumPy
+operations. Comparisons are not defined, so a formula that branches on x
+raises a TypeError instead of giving a wrong bound.
+"""
+
+import math
+
+import numpy as np
+
+
+class Interval(object):
+
+    """
+    Descriptions:
+        Closed intervals [lo, hi], elementwise over arrays
+    Args:
+        lo (np.ndarray): lower ends
+        hi (np.ndarray): upper ends, same shape
+    Attributes:
+        lo (np.ndarray): lower ends
+        hi (np.ndarray): upper ends
+    """
+
+    __array_ufunc__ = None # numbers * Interval falls back to Interval.__rmul__
+
+    def __init__(self, lo, hi):
+
+        self.lo = np.asarray(lo, dtype=float)
+        self.hi = np.asarray(hi, dtype=float)
+
+    def __getitem__(self, i):
+        return Interval(self.lo[i], self.hi[i])
+
+    def __len__(self):
+        return len(self.lo)
+
+    @property
+    def ndim(self):
+        return self.lo.ndim
+
+    def __repr__(self):
+        return 'Interval({}, {})'.format(self.lo, self.hi)
+
+    def __pos__(self):
+        return self
+
+    def __neg__(self):
+        return Interval(-self.hi, -self.lo)
+
+    def __add__(self, other):
+        other = as_interval(other)
+        return _outward(self.lo + other.lo, self.hi + other.hi)
+
+    def __sub__(self, other):
+        other = as_interval(other)
+        return _outward(self.lo - other.hi, self.hi - other.lo)
+
+    def __mul__(self, other):
+        other = as_interval(other)
+        products = [self.lo*other.lo, self.lo*other.hi, self.hi*other.lo, self.hi*other.hi]
+        return _outward(np.fmin.reduce(products), np.fmax.reduce(products)) # 0*inf is 0
+
+    def __truediv__(self, other):
+        return self*_inverse(as_interval(other))
+
+    def __radd__(self, other):
+        return self + other
+
+    def __rsub__(self, other):
+        return as_interval(other) - self
+
+    def __rmul__(self, other):
+        return self*other
+
+    def __rtruediv__(self, other):
+        return as_interval(other)*_inverse(self)
+
+    def __pow__(self, p):
+
+        if isinstance(p, Interval):
+            return exp(p*log(self))
+        p = float(p)
+        lo, hi = self.lo, self.hi
+        if p == 0.0:
+            return Interval(np.ones_like(lo), np.ones_like(hi))
+        if p < 0.0:
+            return 1.0/self**(-p)
+        if p.is_integer() and p % 2 == 1.0: # odd, increasing
+            return _outward(lo**p, hi**p, 4)
+        if p.is_integer(): # even, smallest at the end nearest to 0
+            a = lo**p
+            b = hi**p
+            low = np.where(lo > 0.0, a, np.where(hi < 0.0, b, 0.0))
+            return _clip(_outward(low, np.maximum(a, b), 4), 0.0)
+        lo = np.where(hi < 0.0, np.nan, np.maximum(lo, 0.0)) # real powers of x >= 0 only
+        return _clip(_outward(lo**p, hi**p, 4), 0.0)
+
+    def __rpow__(self, c):
+        return exp(self*math.log(c))
+
+    def __abs__(self):
+        lo, hi = self.lo, self.hi
+        low = np.where(lo > 0.0, lo, np.where(hi < 0.0, -hi, 0.0))
+        return Interval(low, np.maximum(-lo, hi))
+
+
+def as_interval(x):
+
+    """ x as an Interval, a number becomes the interval [x, x] """
+
+    if isinstance(x, Interval):
+        return x
+    x = np.asarray(x, dtype=float)
+    return Interval(x, x)
+
+
+def sin(x):
+    return _periodic(as_interval(x), np.sin, 0.5*np.pi)
+
+
+def cos(x):
+    return _periodic(as_interval(x), np.cos, 0.0)
+
+
+def exp(x):
+    x = as_interval(x)
+    return _clip(_outward(np.exp(x.lo), np.exp(x.hi), 4), 0.0)
+
+
+def log(x):
+    x = as_interval(x)
+    lo = np.where(x.hi < 0.0, np.nan, np.maximum(x.lo, 0.0))
+    return _outward(np.log(lo), np.log(x.hi), 4)
+
+
+def sqrt(x):
+    x = as_interval(x)
+    lo = np.where(x.hi < 0.0, np.nan, np.maximum(x.lo, 0.0))
+    return _clip(_outward(np.sqrt(lo), np.sqrt(x.hi), 4), 0.0)
+
+
+def _outward(lo, hi, ulps=1):
+
+    """ Interval(lo, hi) widened by ulps units in the last place on each side """
+
+    for _ in range(ulps):
+        lo = np.nextafter(lo, -np.inf)
+        hi = np.nextafter(hi, np.inf)
+    return Interval(lo, hi)
+
+
+def _clip(x, lo=-np.inf, hi=np.inf):
+
+    """ x with its ends clipped to the known range [lo, hi] of the function """
+
+    return Interval(np.clip(x.lo, lo, hi), np.clip(x.hi, lo, hi))
+
+
+def _inverse(x):
+
+    """ 1/x, the whole real line when x contains 0 """
+
+    zero = (x.lo <= 0.0) & (x.hi >= 0.0)
+    with np.errstate(divide='ignore'):
+        lo = np.where(zero, -np.inf, 1.0/x.hi)
+        hi = np.where(zero, np.inf, 1.0/x.lo)
+    return _outward(lo, hi)
+
+
+def _periodic(x, f, peak):
+
+    """ range of sin or cos over x, f being 1 at peak + 2k*pi and -1 at peak + pi + 2k*pi """
+
+    two_pi = 2.0*np.pi
+    a = f(x.lo)
+    b = f(x.hi)
+    lo = np.minimum(a, b)
+    hi = np.maximum(a, b)
+
+    # -- extrema inside x, checked on a slightly larger x so that the
+    #    rounding of k*2*pi cannot miss one
+
+    slack = 1e-12*(1.0 + np.abs(x.lo) + np.abs(x.hi))
+    start = x.lo - slack
+    stop = x.hi + slack
+    wide = ~(stop - start < two_pi) # also inf and nan ends
+    has_peak = wide | (peak + two_pi*np.ceil((start - peak)/two_pi) <= stop)
+    has_trough = wide | (peak + np.pi + two_pi*np.ceil((start - peak - np.pi)/two_pi) <= stop)
+    lo = np.where(has_trough, -1.0, lo)
+    hi = np.where(has_peak, 1.0, hi)
+    return _clip(_outward(lo, hi, 4), -1.0, 1.0)
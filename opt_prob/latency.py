@@ -0,0 +1,108 @@
+"""
+Latency transforms:
+make a cheap problem behave like an expensive simulation, to test
+asynchronous and batch-parallel solvers.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from .base import Wrapper
+
+
+class Slow(Wrapper):
+
+    """
+    Descriptions:
+        Problem whose obj takes `delay` seconds per evaluation. delay is
+        either a number or a function delay(x, rng) of the point and of a
+        numpy.random.Generator, so it can be random and depend on the region
+        of x, see `lognormal_delay`. The wait sleeps by default, which frees
+        the CPU and the GIL, or holds the CPU in a busy loop with busy=True.
+        cns are not delayed: obj and cns of a point count as one simulation.
+    Args:
+        problem (Cons or NonCons): problem to slow down
+        delay (float or func): seconds per evaluation, or delay(x, rng)
+        busy (bool): hold the CPU while waiting
+        seed (int): seed of the Generator passed to delay
+    Attributes:
+        evaluations (int): number of obj evaluations so far
+        total_delay (float): seconds of delay so far
+    """
+
+    def __init__(self, problem, delay=0.1, busy=False, seed=0):
+
+        Wrapper.__init__(self, problem)
+        self.delay = delay
+        self.busy = busy
+        self.rng = np.random.default_rng(seed)
+        self.evaluations = 0
+        self.total_delay = 0.0
+        self._lock = threading.Lock()
+
+        f = problem.obj
+
+        def obj(x):
+            y = f(x)
+            self.wait(x)
+            return y
+
+        self.obj = obj
+        self.__doc__ = """
+            Slow, delay = {}
+            """.format(delay) + problem.__doc__
+
+    def wait(self, x):
+
+        """ wait for the delay of one evaluation at x """
+
+        with self._lock:
+            if callable(self.delay):
+                seconds = float(self.delay(x, self.rng))
+            else:
+                seconds = float(self.delay)
+            self.evaluations += 1
+            self.total_delay += seconds
+
+        if self.busy:
+            end = time.perf_counter() + seconds
+            while time.perf_counter() < end:
+                pass
+        elif seconds > 0.0:
+            time.sleep(seconds)
+
+    def obj_batch(self, X, out=None, max_bytes=None):
+        X = np.asarray(X, dtype=float)
+        F = self.problem.obj_batch(X, out, max_bytes)
+        for x in X.tolist():
+            self.wait(x)
+        return F
+
+
+def lognormal_delay(median, sigma=0.5, slow_region=None, factor=10.0):
+
+    """
+    Descriptions:
+        Delay function for Slow, lognormal around `median` seconds. Points
+        inside `slow_region` take `factor` times longer, to mimic
+        simulations that struggle in some part of the box.
+    Args:
+        median (float): median delay in seconds
+        sigma (float): standard deviation of the log of the delay
+        slow_region (tuple): (lb, ub) of the slow box, None for no slow box
+        factor (float): delay factor inside the slow box
+    Returns:
+        func: delay(x, rng)
+    """
+
+    def delay(x, rng):
+        seconds = median*rng.lognormal(0.0, sigma)
+        if slow_region is not None:
+            x = np.asarray(x, dtype=float)
+            if np.all(x >= slow_region[0]) and np.all(x <= slow_region[1]):
+                seconds = seconds*factor
+        return seconds
+
+    return delay
@@ -0,0 +1,139 @@
+"""
+Lipschitz constants of the problems, used through Problem.lipschitz.
+
+A sampled estimate costs 2*dimensions*samples evaluations, so the constants
+of Cons and NonCons problems are computed once per (name, dimensions) and
+kept in memory. Nothing is written to disk unless `path` is set, e.g. to
+`cache_path`: the constants are then also kept in that JSON file, which
+later runs read back. Wrappers are estimated on every call: they share the
+name of the problem they wrap but not its functions.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from .base import Collection
+from .cons import Cons
+
+cache_path = os.path.join(os.path.expanduser('~'), '.cache', 'opt_prob', 'lipschitz.json')
+path = None # JSON file of the constants, None for memory only
+
+_constants = {}
+
+
+def constants(problem, samples=1024, seed=0):
+
+    """
+    Descriptions:
+        Lipschitz constants of obj and of each cns, from the caches when
+        they hold an estimate with the same samples and seed
+    Args:
+        problem (Cons or NonCons): problem
+        samples (int): number of sampled points
+        seed (int): seed of the sample
+    Returns:
+        L (float): constant of obj
+        L_cns (np.ndarray): constants of the cns, shape (number of cns,)
+    """
+
+    if not isinstance(problem, Collection):
+        return estimate(problem, samples, seed)
+
+    key = '{}|{}'.format(problem.name, len(problem.lb))
+    entry = _constants.get(key)
+    if not _matches(entry, samples, seed):
+        entry = _load().get(key)
+    if not _matches(entry, samples, seed):
+        single = type(problem)(problem.name, problem.dimensions) # float64 differences
+        L, L_cns = estimate(single, samples, seed)
+        entry = {'obj': L, 'cns': L_cns.tolist(), 'samples': samples, 'seed': seed}
+        _save(key, entry)
+    _constants[key] = entry
+    return entry['obj'], np.array(entry['cns'], dtype=float)
+
+
+def estimate(problem, samples=1024, seed=0):
+
+    """
+    Descriptions:
+        Largest gradient norm of obj and of each cns at `samples` random
+        points of the box, with central differences evaluated in batches.
+        Linear cns of a Cons problem get the exact constant, the norm of
+        their row of A.
+    Args:
+        problem (Cons or NonCons): problem
+        samples (int): number of sampled points
+        seed (int): seed of the sample
+    Returns:
+        L (float): constant of obj
+        L_cns (np.ndarray): constants of the cns, shape (number of cns,)
+    """
+
+    lb = np.asarray(problem.lb, dtype=float)
+    ub = np.asarray(problem.ub, dtype=float)
+    d = len(lb)
+    h = 1e-6*(ub - lb)
+    X = lb + h + (ub - lb - 2.0*h)*np.random.RandomState(seed).uniform(size=(samples, d))
+    steps = np.concatenate([np.diag(h), -np.diag(h)]) # (2d, d)
+
+    L = 0.0
+    L_cns = None
+    block = max(1, 2**16//(2*d)) # sampled points per batch call
+    with np.errstate(all='ignore'):
+        for i in range(0, samples, block):
+            P = (X[i:i+block, None, :] + steps).reshape(-1, d)
+            n = P.shape[0]//(2*d)
+
+            F = problem.obj_batch(P).reshape(n, 2, d)
+            grad = (F[:, 0] - F[:, 1])/(2.0*h)
+            L = np.fmax(L, np.nanmax(np.sqrt(np.sum(grad**2, axis=1)), initial=0.0))
+
+            G = problem.cns_batch(P)
+            G = G.reshape(n, 2, d, G.shape[1])
+            grad = (G[:, 0] - G[:, 1])/(2.0*h)[:, None]
+            norms = np.nanmax(np.sqrt(np.sum(grad**2, axis=1)), axis=0, initial=0.0)
+            L_cns = norms if L_cns is None else np.fmax(L_cns, norms)
+
+    if isinstance(problem, Cons):
+        for r, k in enumerate(problem.lin):
+            L_cns[k] = np.linalg.norm(problem.A[r])
+    return float(L), L_cns
+
+
+def _matches(entry, samples, seed):
+
+    """ whether a cached entry was estimated with these samples and seed """
+
+    return entry is not None and entry['samples'] == samples and entry['seed'] == seed
+
+
+def _load():
+
+    """ the constants stored at path, {} when there are none """
+
+    if path is None or not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except ValueError: # e.g. a file cut short, it is rewritten on the next save
+        return {}
+
+
+def _save(key, entry):
+
+    """ store one entry at path, replacing the file at once """
+
+    if path is None:
+        return
+    stored = _load()
+    stored[key] = entry
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    temp = '{}.{}'.format(path, os.getpid())
+    with open(temp, 'w') as f:
+        json.dump(stored, f, indent=1, sort_keys=True)
+    os.replace(temp, path)
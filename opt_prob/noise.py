@@ -0,0 +1,136 @@
+"""
+Noise transforms:
+evaluate a problem with random noise added to its obj, reproducibly.
+"""
+
+import numpy as np
+
+from .base import Wrapper
+
+
+class Noisy(Wrapper):
+
+    """
+    Descriptions:
+        Noisy obj, f(x)*(1 + rel_sd*e1) + sd*e2 with e1, e2 standard normal.
+        The noise is counter-based: a splitmix64 hash of (seed, stream), of
+        the bytes of the point and of the replicate number gives two
+        uniforms, turned into normals with the Box-Muller transform, for
+        all the points of a batch at once in array operations. The noise
+        at a point therefore does not depend on the order of the calls, on
+        the batching or on the process doing the evaluation. Give each worker
+        its own stream for independent noise, and pass replicate to obj to
+        draw again at the same point. cns, fopt and xopt are noise-free.
+    Args:
+        problem (Cons or NonCons): problem to evaluate with noise
+        sd (float): standard deviation of the additive noise
+        rel_sd (float): standard deviation of the multiplicative noise
+        seed (int): seed of the noise
+        stream (int): stream of the noise, e.g. one per worker
+    Attributes:
+        sd (float): standard deviation of the additive noise
+        rel_sd (float): standard deviation of the multiplicative noise
+        seed (int): seed of the noise
+        stream (int): stream of the noise
+    """
+
+    def __init__(self, problem, sd=0.0, rel_sd=0.0, seed=0, stream=0):
+
+        Wrapper.__init__(self, problem)
+        self.sd = sd
+        self.rel_sd = rel_sd
+        self.seed = seed
+        self.stream = stream
+
+        f = problem.obj
+
+        def obj(x, replicate=0):
+            e = self.normal(x, replicate)
+            return f(x)*(1.0 + self.rel_sd*e[0]) + self.sd*e[1]
+
+        self.obj = obj
+        self.delta = None
+        self.__doc__ = """
+            Noisy, sd = {}, rel_sd = {}
+            """.format(sd, rel_sd) + problem.__doc__
+
+    def normal(self, x, replicate=0):
+
+        """
+        Descriptions:
+            The two standard normal draws (multiplicative, additive) used at
+            a point
+        Args:
+            x (List[float]): point
+            replicate (int): replicate number
+        Returns:
+            np.ndarray: the draws, shape (2,)
+        """
+
+        return self.normal_batch(np.reshape(np.asarray(x, dtype=float), (1, -1)), [replicate])[0]
+
+    def normal_batch(self, X, replicates=None):
+
+        """
+        Descriptions:
+            The normal draws of many points, see normal
+        Args:
+            X (np.ndarray): points, shape (n, dimensions)
+            replicates (List[int]): replicate number of each point, zeros by default
+        Returns:
+            np.ndarray: the draws, shape (n, 2)
+        """
+
+        words = np.ascontiguousarray(X, dtype=np.float64).view(np.uint64)
+        h = np.full(words.shape[0], _splitmix64(np.array([self.seed], dtype=np.uint64))[0])
+        h = _splitmix64(h ^ np.uint64(self.stream))
+        for j in range(words.shape[1]):
+            h = _splitmix64(h ^ words[:, j])
+        if replicates is None:
+            replicates = np.zeros(words.shape[0], dtype=np.int64)
+        h = _splitmix64(h ^ np.asarray(replicates, dtype=np.int64).view(np.uint64))
+
+        # -- two uniforms in (0, 1) from 53 bits each, then Box-Muller
+
+        u1 = ((_splitmix64(h ^ _ONE) >> np.uint64(11)).astype(float) + 0.5)*2.0**-53
+        u2 = ((_splitmix64(h ^ _TWO) >> np.uint64(11)).astype(float) + 0.5)*2.0**-53
+        r = np.sqrt(-2.0*np.log(u1))
+        E = np.empty((words.shape[0], 2))
+        np.multiply(r, np.cos(2.0*np.pi*u2), out=E[:, 0])
+        np.multiply(r, np.sin(2.0*np.pi*u2), out=E[:, 1])
+        return E
+
+    def obj_batch(self, X, out=None, max_bytes=None, *, replicates=None):
+
+        """
+        Descriptions:
+            Evaluate the noisy obj at many points
+        Args:
+            X (np.ndarray): points, shape (n, dimensions)
+            out (np.ndarray): optional array receiving the values
+            max_bytes (int): cap on the chunks of the wrapped problem's batch call
+            replicates (List[int]): replicate number of each point, zeros by default
+        Returns:
+            np.ndarray: noisy obj values, shape (n,)
+        """
+
+        X = np.asarray(X, dtype=float)
+        E = self.normal_batch(X, replicates)
+        F = self.problem.obj_batch(X, out, max_bytes)
+        F *= 1.0 + self.rel_sd*E[:, 0]
+        F += self.sd*E[:, 1]
+        return F
+
+
+_ONE = np.uint64(0x9E3779B97F4A7C15)
+_TWO = np.uint64(0x3C6EF372FE94F82A)
+
+
+def _splitmix64(z):
+
+    """ splitmix64 finalizer of a uint64 array, wrapping around """
+
+    z = z + _ONE
+    z = (z ^ (z >> np.uint64(30)))*np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27)))*np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
@@ -7,25 +7,43 @@ Non-constrained optimization problem collections.
 5. Steep Ridges/Drops
 6. Other
 """
+import math
+
 import numpy as np
 
+from .base import Collection
+from .structure import structure_of
+from .util import lib_of
+
 
-class NonCons:
+class NonCons(Collection):
 
     """
     Descriptions:
         Non-constrained optimization problem
     Args:
         name (str): problem's name
+        dimensions (int): dimensions of a scalable problem
+        dtype (np.dtype): float type of obj_batch and cns_batch, np.float32
+            for single precision, single points are always float64
     Attributes:
+        name (str): problem's name
+        dimensions (int): dimensions argument the problem was built with
+        dtype (np.dtype): float type of the batch evaluations
         obj (func): objfunction
         cns (None):
-        lb (List[float]): lower bound of variables
-        ub (List[float]): upper bound of variables
-        xopt (List[float]): solution's variables
+        delta (func): obj value after moving one coordinate, delta(x, i, new, f)
+            returns obj of x with x[i] set to new given f = obj(x), in constant
+            time; None if the problem has no separable structure to exploit
+        lb (np.ndarray): lower bound of variables, read-only
+        ub (np.ndarray): upper bound of variables, read-only
+        xopt (np.ndarray): known solutions, shape (k, dimensions), read-only
         fopt (float): solution's obj value
+        structure (dict): separability and variable interactions, see structure_of
     """
 
+    __slots__ = ()
+
     names = [
         "1.1 Ackley Function", 
         "1.2 Bukin Function N. 6", 
@@ -74,7 +92,9 @@ class NonCons:
         "6.14 Styblinski-Tang Function", 
         ]
         
-    def __init__(self, name, dimensions=2):
+    def _build(self, name, dimensions, dtype):
+
+        self.delta = None
 
         if name == '1.1 Ackley Function':
 
@@ -99,26 +119,29 @@ class NonCons:
             Press on Demand.
             """
 
+            a = 20.0
+            b = 0.2
+            c = 2.0*np.pi
+            e = math.e
+
             def obj(x):
+                lib = lib_of(x)
                 d = dimensions
-                a = 20.0
-                b = 0.2
-                c = 2.0*np.pi
                 sum1 = 0.0
                 sum2 = 0.0
                 for xi in x:
                     sum1 = sum1 + xi**2.0
-                    sum2 = sum2 + np.cos(c*xi)
-                term1 = - a * np.exp(-b*np.sqrt(sum1/d))
-                term2 = - np.exp(sum2/d)
-                y = term1 + term2 + a + np.exp(1)
+                    sum2 = sum2 + lib.cos(c*xi)
+                term1 = - a * lib.exp(-b*lib.sqrt(sum1/d))
+                term2 = - lib.exp(sum2/d)
+                y = term1 + term2 + a + e
                 return y
 
             self.obj = obj
             self.cns = None
-            self.lb = [-39.0, -39.0] # original bound = -40
-            self.ub = [40.0, 40.0]
-            self.xopt = [0.0, 0.0]
+            self.lb = (np.ones(dimensions)*-39.0).tolist() # original bound = -40
+            self.ub = (np.ones(dimensions)*40.0).tolist()
+            self.xopt = np.zeros(dimensions).tolist()
             self.fopt = 0.0
 
         elif name == '1.2 Bukin Function N. 6':
@@ -135,9 +158,10 @@ class NonCons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 x1 = x[0]
                 x2 = x[1]
-                term1 = 100.0 * np.sqrt(abs(x2 - 0.01*x1**2))
+                term1 = 100.0 * lib.sqrt(abs(x2 - 0.01*x1**2))
                 term2 = 0.01 * abs(x1 + 10.0)
                 y = term1 + term2
                 return y
@@ -165,10 +189,11 @@ class NonCons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 x1 = x[0]
                 x2 = x[1]
-                fact1 = np.sin(x1)*np.sin(x2)
-                fact2 = np.exp(abs(100.0 - np.sqrt(x1**2+x2**2)/np.pi))
+                fact1 = lib.sin(x1)*lib.sin(x2)
+                fact2 = lib.exp(abs(100.0 - lib.sqrt(x1**2+x2**2)/np.pi))
                 y = - 0.0001 * (abs(fact1*fact2)+1.0)**0.1
                 return y
 
@@ -195,9 +220,10 @@ class NonCons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 x1 = x[0]
                 x2 = x[1]
-                frac1 = 1.0 + np.cos(12.0*np.sqrt(x1**2+x2**2))
+                frac1 = 1.0 + lib.cos(12.0*lib.sqrt(x1**2+x2**2))
                 frac2 = 0.5*(x1**2+x2**2) + 2.0
                 y = - frac1/frac2
                 return y
@@ -224,10 +250,11 @@ class NonCons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 x1 = x[0]
                 x2 = x[1]
-                term1 = -(x2+47.0) * np.sin(np.sqrt(abs(x2+x1/2.0+47.0)))
-                term2 = -x1 * np.sin(np.sqrt(abs(x1-(x2+47.0))))
+                term1 = -(x2+47.0) * lib.sin(lib.sqrt(abs(x2+x1/2.0+47.0)))
+                term2 = -x1 * lib.sin(lib.sqrt(abs(x1-(x2+47.0))))
                 y = term1 + term2
                 return y
 
@@ -254,10 +281,11 @@ class NonCons:
             """
 
             def obj(x):
-                x = np.array(x)
-                term1 = np.sin(10.0*np.pi*x) / (2.0*x)
-                term2 = (x-1.0)**4
-                f = term1[0] + term2[0]
+                lib = lib_of(x)
+                x1 = x[0]
+                term1 = lib.sin(10.0*np.pi*x1) / (2.0*x1)
+                term2 = (x1-1.0)**4
+                f = term1 + term2
                 return f
 
             self.obj = obj
@@ -283,22 +311,25 @@ class NonCons:
             Retrieved June 2013, from http://www.zsd.ict.pwr.wroc.pl/files/docs/functions.pdf.
             """
 
+            sqrt_i = [math.sqrt(ii) for ii in range(1, dimensions+1)]
+
             def obj(x):
+                lib = lib_of(x)
                 d = dimensions
                 total = 0
                 prod = 1
                 for ii in range(1, d+1):
                     xi = x[ii-1]
                     total = total + (xi**2)/4000.0
-                    prod = prod * np.cos(xi/np.sqrt(ii))
+                    prod = prod * lib.cos(xi/sqrt_i[ii-1])
                 f = total - prod + 1
                 return f
 
             self.obj = obj
             self.cns = None
-            self.lb = [-9, -9] # original bound = -10.0
-            self.ub = [10, 10]
-            self.xopt = [0, 0]
+            self.lb = (np.ones(dimensions)*-9.0).tolist() # original bound = -10.0
+            self.ub = (np.ones(dimensions)*10.0).tolist()
+            self.xopt = np.zeros(dimensions).tolist()
             self.fopt = 0.0
 
         elif name == '1.8 Holder Table Function':
@@ -317,10 +348,11 @@ class NonCons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 x1 = x[0]
                 x2 = x[1]
-                fact1 = np.sin(x1)*np.cos(x2)
-                fact2 = np.exp(abs(1.0 - np.sqrt(x1**2+x2**2)/np.pi))
+                fact1 = lib.sin(x1)*lib.cos(x2)
+                fact2 = lib.exp(abs(1.0 - lib.sqrt(x1**2+x2**2)/np.pi))
                 f = - abs(fact1*fact2)
                 return f
 
@@ -348,16 +380,17 @@ class NonCons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 d = dimensions
                 w = []
                 for ii in range(2):
                     w.append(1.0 + (x[ii] - 1.0)/4.0)
-                term1 = (np.sin(np.pi*w[0]))**2
-                term3 = (w[d-1]-1.0)**2 * (1.0+(np.sin(2*np.pi*w[d-1]))**2)
+                term1 = (lib.sin(np.pi*w[0]))**2
+                term3 = (w[d-1]-1.0)**2 * (1.0+(lib.sin(2*np.pi*w[d-1]))**2)
                 total = 0
                 for ii in range(1):
                     wi = w[ii]
-                    new = (wi-1.0)**2 * (1.0+10.0*(np.sin(np.pi*wi+1))**2)
+                    new = (wi-1.0)**2 * (1.0+10.0*(lib.sin(np.pi*wi+1))**2)
                     total = total + new
                 f = term1 + total + term3
                 return f
@@ -383,11 +416,12 @@ class NonCons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 x1 = x[0]
                 x2 = x[1]
-                term1 = (np.sin(3*np.pi*x1))**2
-                term2 = (x1-1.0)**2 * (1+(np.sin(3*np.pi*x2))**2)
-                term3 = (x2-1.0)**2 * (1+(np.sin(2*np.pi*x2))**2)
+                term1 = (lib.sin(3*np.pi*x1))**2
+                term2 = (x1-1.0)**2 * (1+(lib.sin(3*np.pi*x2))**2)
+                term3 = (x2-1.0)**2 * (1+(lib.sin(2*np.pi*x2))**2)
                 f = term1 + term2 + term3;
                 return f
 
@@ -416,18 +450,27 @@ class NonCons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 d = dimensions
                 total = 0
                 for xi in x:
-                    total = total + (xi**2 - 10.0*np.cos(2.0*np.pi*xi))
+                    total = total + (xi**2 - 10.0*lib.cos(2.0*np.pi*xi))
                 f = 10.0*d + total
                 return f
 
+            def delta(x, i, new, f):
+                lib = lib_of(x)
+                old = x[i]
+                term_old = old**2 - 10.0*lib.cos(2.0*np.pi*old)
+                term_new = new**2 - 10.0*lib.cos(2.0*np.pi*new)
+                return f + term_new - term_old
+
             self.obj = obj
             self.cns = None
-            self.lb = [-4, -4] # original bound = -5.0
-            self.ub = [5, 5]
-            self.xopt = [0, 0]
+            self.delta = delta
+            self.lb = (np.ones(dimensions)*-4.0).tolist() # original bound = -5.0
+            self.ub = (np.ones(dimensions)*5.0).tolist()
+            self.xopt = np.zeros(dimensions).tolist()
             self.fopt = 0.0
 
         elif name == '1.13 Schaffer Function N. 2':
@@ -444,9 +487,10 @@ class NonCons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 x1 = x[0]
                 x2 = x[1]
-                fact1 = (np.sin(x1**2-x2**2))**2 - 0.5
+                fact1 = (lib.sin(x1**2-x2**2))**2 - 0.5
                 fact2 = (1.0 + 0.001*(x1**2+x2**2))**2
                 f = 0.5 + fact1/fact2;
                 return f
@@ -472,9 +516,10 @@ class NonCons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 x1 = x[0]
                 x2 = x[1]
-                fact1 = np.cos(np.sin(abs(x1**2-x2**2))) - 0.5
+                fact1 = lib.cos(lib.sin(abs(x1**2-x2**2))) - 0.5
                 fact2 = (1.0 + 0.001*(x1**2+x2**2))**2
                 f = 0.5 + fact1/fact2
                 return f
@@ -507,19 +552,28 @@ class NonCons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 d = dimensions
                 total = 0
                 for ii in range(d):
                     xi = x[ii]
-                    total = total + xi*np.sin(np.sqrt(abs(xi)))
+                    total = total + xi*lib.sin(lib.sqrt(abs(xi)))
                 f = 418.9829*d - total
                 return f
 
+            def delta(x, i, new, f):
+                lib = lib_of(x)
+                old = x[i]
+                term_old = old*lib.sin(lib.sqrt(abs(old)))
+                term_new = new*lib.sin(lib.sqrt(abs(new)))
+                return f - term_new + term_old
+
             self.obj = obj
             self.cns = None
-            self.lb = [-500, -500]
-            self.ub = [500, 500]
-            self.xopt = [420.9687, 420.9687]
+            self.delta = delta
+            self.lb = (np.ones(dimensions)*-500.0).tolist()
+            self.ub = (np.ones(dimensions)*500.0).tolist()
+            self.xopt = (np.ones(dimensions)*420.9687).tolist()
             self.fopt = 0
 
         elif name == '1.16 Shubert Function':
@@ -529,20 +583,21 @@ class NonCons:
             
             Dimensions: 2
 
-            The Shubert function has several local minima and many global minima.
+            The Shubert function has several local minima and 18 global minima.
 
             Global Optimization Test Problems. Retrieved June 2013, from
             http://www-optima.amp.i.kyoto-u.ac.jp/member/student/hedar/Hedar_files/TestGO.htm
             """
 
             def obj(x):
+                lib = lib_of(x)
                 x1 = x[0]
                 x2 = x[1]
                 sum1 = 0
                 sum2 = 0
                 for ii in range(1, 6):
-                    new1 = ii * np.cos((ii+1)*x1+ii)
-                    new2 = ii * np.cos((ii+1)*x2+ii)
+                    new1 = ii * lib.cos((ii+1)*x1+ii)
+                    new2 = ii * lib.cos((ii+1)*x2+ii)
                     sum1 = sum1 + new1
                     sum2 = sum2 + new2
                 y = sum1 * sum2
@@ -552,7 +607,12 @@ class NonCons:
             self.cns = None
             self.lb = [-10, -10]
             self.ub = [10, 10]
-            self.xopt = [-1.425128, -0.800273]
+            self.xopt = [[-7.708314, -7.083506], [-7.708314, -0.800321], [-7.708314, 5.482864],
+                         [-7.083506, -7.708314], [-7.083506, -1.425128], [-7.083506, 4.858057],
+                         [-1.425128, -7.083506], [-1.425128, -0.800321], [-1.425128, 5.482864],
+                         [-0.800321, -7.708314], [-0.800321, -1.425128], [-0.800321, 4.858057],
+                         [4.858057, -7.083506], [4.858057, -0.800321], [4.858057, 5.482864],
+                         [5.482864, -7.708314], [5.482864, -1.425128], [5.482864, 4.858057]]
             self.fopt = -186.7309
 
         elif name == '2.1 Bohachevsky Function':
@@ -570,19 +630,32 @@ class NonCons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 x1 = x[0]
                 x2 = x[1]
 
                 term1 = x1**2
                 term2 = 2*x2**2
-                term3 = -0.3 * np.cos(3*np.pi*x1)
-                term4 = -0.4 * np.cos(4*np.pi*x2)
+                term3 = -0.3 * lib.cos(3*np.pi*x1)
+                term4 = -0.4 * lib.cos(4*np.pi*x2)
 
                 y = term1 + term2 + term3 + term4 + 0.7
                 return y
 
+            def delta(x, i, new, f):
+                lib = lib_of(x)
+                old = x[i]
+                if i == 0:
+                    term_old = old**2 - 0.3*lib.cos(3*np.pi*old)
+                    term_new = new**2 - 0.3*lib.cos(3*np.pi*new)
+                else:
+                    term_old = 2*old**2 - 0.4*lib.cos(4*np.pi*old)
+                    term_new = 2*new**2 - 0.4*lib.cos(4*np.pi*new)
+                return f + term_new - term_old
+
             self.obj = obj
             self.cns = None
+            self.delta = delta
             self.lb = [-99.0, -99.0] # original bound = -100.0
             self.ub = [100.0, 100.0]
             self.xopt = [0.0, 0.0]
@@ -620,7 +693,7 @@ class NonCons:
             self.cns = None
             self.lb = (np.ones(dimensions)*-2.0).tolist()
             self.ub = (np.ones(dimensions)*2.0).tolist()
-            self.xopt = [1, 1.0/2.0] # [..., 1/3, 1/4 ..., 1/d]
+            self.xopt = [1.0/ii for ii in range(1, dimensions+1)]
             self.fopt = 0.0
 
         elif name == '2.3 Rotated Hyper-Ellipsoid Function':
@@ -652,11 +725,17 @@ class NonCons:
                 y = outer
                 return y
 
+            def delta(x, i, new, f):
+                # x[i] appears in the inner sums of the last d-i terms
+                old = x[i]
+                return f + (dimensions-i)*(new**2 - old**2)
+
             self.obj = obj
             self.cns = None
+            self.delta = delta
             self.lb = (np.ones(dimensions)*-59.0).tolist()
             self.ub = (np.ones(dimensions)*60.0).tolist()
-            self.xopt = [0.0, 0.0] # [..., 0.0]
+            self.xopt = np.zeros(dimensions).tolist()
             self.fopt = 0.0
 
         elif name == '2.4 Sphere Function Modified':
@@ -686,8 +765,13 @@ class NonCons:
                 y = (sum - 1745.0) / 899.0
                 return y
 
+            def delta(x, i, new, f):
+                old = x[i]
+                return f + (new**2 - old**2)*(2**(i+1)) / 899.0
+
             self.obj = obj
             self.cns = None
+            self.delta = delta
             self.lb = (np.ones(6)*-0.9).tolist() # original bound = -1.0
             self.ub = (np.ones(6)*1.0).tolist()
             self.xopt = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
@@ -719,11 +803,16 @@ class NonCons:
                 y = sum
                 return y 
 
+            def delta(x, i, new, f):
+                old = x[i]
+                return f + (abs(new))**(i+2.0) - (abs(old))**(i+2.0)
+
             self.obj = obj
             self.cns = None
+            self.delta = delta
             self.lb = (np.ones(dimensions)*-0.9).tolist() # original bound = -1.0
             self.ub = (np.ones(dimensions)*1.0).tolist()
-            self.xopt = [0.0, 0.0] # [..., 0.0]
+            self.xopt = np.zeros(dimensions).tolist()
             self.fopt = 0.0
 
         elif name == '2.6 Sum Squares Function':
@@ -753,11 +842,16 @@ class NonCons:
                 y = sum
                 return y
 
+            def delta(x, i, new, f):
+                old = x[i]
+                return f + (i+1)*(new**2 - old**2)
+
             self.obj = obj
             self.cns = None
+            self.delta = delta
             self.lb = (np.ones(dimensions)*-9.0).tolist() # original bound = -10.0
             self.ub = (np.ones(dimensions)*10.0).tolist()
-            self.xopt = [0.0, 0.0] # [..., 0.0]
+            self.xopt = np.zeros(dimensions).tolist()
             self.fopt = 0.0
 
         elif name == '2.7 Trid Function':
@@ -791,11 +885,22 @@ class NonCons:
                 y = sum1 - sum2
                 return y
 
+            def delta(x, i, new, f):
+                d = dimensions
+                old = x[i]
+                neighbors = 0
+                if i > 0:
+                    neighbors = neighbors + x[i-1]
+                if i < d-1:
+                    neighbors = neighbors + x[i+1]
+                return f + (new-1.0)**2 - (old-1.0)**2 - (new-old)*neighbors
+
             self.obj = obj
             self.cns = None
+            self.delta = delta
             self.lb = (np.ones(dimensions)*-0.9*dimensions**2).tolist() # original bound = -dimensions
             self.ub = (np.ones(dimensions)*dimensions**2).tolist()
-            self.xopt = [1*(dimensions+1-1), 2*(dimensions+1-2)]
+            self.xopt = [ii*(dimensions+1-ii) for ii in range(1, dimensions+1)]
             self.fopt = - dimensions*(dimensions+4.0)*(dimensions-1.0)/6.0
 
         elif name == '3.1 Booth Function':
@@ -867,9 +972,10 @@ class NonCons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 x1 = x[0]
                 x2 = x[1]
-                term1 = np.sin(x1 + x2)
+                term1 = lib.sin(x1 + x2)
                 term2 = (x1 - x2)**2
                 term3 = -1.5*x1
                 term4 = 2.5*x2
@@ -914,7 +1020,7 @@ class NonCons:
             self.cns = None
             self.lb = (np.ones(dimensions)*-5.0).tolist()
             self.ub = (np.ones(dimensions)*10.0).tolist()
-            self.xopt = [0.0, 0.0]
+            self.xopt = np.zeros(dimensions).tolist()
             self.fopt = 0.0
 
         elif name == '4.1 Three-Hump Camel Function':
@@ -1004,11 +1110,25 @@ class NonCons:
                 y = term1 + sum
                 return y
 
+            def delta(x, i, new, f):
+                d = dimensions
+                old = x[i]
+                if i == 0:
+                    f = f + (new-1)**2 - (old-1)**2
+                else:
+                    xold = x[i-1]
+                    f = f + (i+1)*((2*new**2 - xold)**2 - (2*old**2 - xold)**2)
+                if i < d-1:
+                    xnext = x[i+1]
+                    f = f + (i+2)*((2*xnext**2 - new)**2 - (2*xnext**2 - old)**2)
+                return f
+
             self.obj = obj
             self.cns = None
+            self.delta = delta
             self.lb = (np.ones(dimensions)*-9.0).tolist() # original bound = -10.0
             self.ub = (np.ones(dimensions)*10.0).tolist()
-            self.xopt = [2.0**(-(2**1-2)/(2**1)), 2.0**(-(2**2-2)/(2**2))] # [..., 2.0**(-(2**d-2)/(2**d))]
+            self.xopt = [2.0**(-(2**ii-2.0)/(2**ii)) for ii in range(1, dimensions+1)]
             self.fopt = 0.0
 
         elif name == '4.4 Rosenbrock Function':
@@ -1049,8 +1169,21 @@ class NonCons:
                 y = sum
                 return y
 
+            def delta(x, i, new, f):
+                d = dimensions
+                old = x[i]
+                if i > 0:
+                    xprev = x[i-1]
+                    f = f + 100.0*((new-xprev**2)**2 - (old-xprev**2)**2)
+                if i < d-1:
+                    xnext = x[i+1]
+                    f = f + 100.0*((xnext-new**2)**2 - (xnext-old**2)**2)
+                    f = f + (new-1.0)**2 - (old-1.0)**2
+                return f
+
             self.obj = obj
             self.cns = None
+            self.delta = delta
             self.lb = (np.ones(dimensions)*-5.0).tolist()
             self.ub = (np.ones(dimensions)*10.0).tolist()
             self.xopt = (np.ones(dimensions)*1.0).tolist()
@@ -1071,10 +1204,11 @@ class NonCons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 x1 = x[0]
                 x2 = x[1]
-                fact1 = -np.cos(x1)*np.cos(x2)
-                fact2 = np.exp(-(x1-np.pi)**2-(x2-np.pi)**2)
+                fact1 = -lib.cos(x1)*lib.cos(x2)
+                fact2 = lib.exp(-(x1-np.pi)**2-(x2-np.pi)**2)
                 y = fact1*fact2
                 return y
 
@@ -1105,20 +1239,30 @@ class NonCons:
             """
 
             def obj(x):
+                lib = lib_of(x)
                 m = 10
                 d = dimensions
                 sum = 0
 
                 for ii in range(1, d+1):
                     xi = x[ii-1]
-                    new = np.sin(xi) * (np.sin(ii*xi**2/np.pi))**(2*m)
+                    new = lib.sin(xi) * (lib.sin(ii*xi**2/np.pi))**(2*m)
                     sum  = sum + new
 
                 y = -sum
                 return y
 
+            def delta(x, i, new, f):
+                lib = lib_of(x)
+                m = 10
+                old = x[i]
+                term_old = lib.sin(old) * (lib.sin((i+1)*old**2/np.pi))**(2*m)
+                term_new = lib.sin(new) * (lib.sin((i+1)*new**2/np.pi))**(2*m)
+                return f - term_new + term_old
+
             self.obj = obj
             self.cns = None
+            self.delta = delta
             self.lb = np.zeros(dimensions).tolist()
             self.ub = (np.ones(dimensions)*np.pi).tolist()
             self.xopt = [2.20, 1.57]
@@ -1176,8 +1320,13 @@ class NonCons:
             criteria for noisy optimization.
             """
 
+            b = 5.1/(4*np.pi**2)
+            c = 5/np.pi
+            t = 1/(8*np.pi)
+
             def obj(x):
-                y = (x[1]-(5.1/(4*np.pi**2))*x[0]**2+5*x[0]/np.pi-6)**2+10*(1-1/(8*np.pi))*np.cos(x[0])+10;
+                lib = lib_of(x)
+                y = (x[1]-b*x[0]**2+c*x[0]-6)**2+10*(1-t)*lib.cos(x[0])+10;
                 return y
 
             self.obj = obj
@@ -1234,11 +1383,12 @@ class NonCons:
             """
 
             def obj(x):
-                x = np.array(x)
-                fact1 = (6*x - 2)**2;
-                fact2 = np.sin(12*x - 4);
+                lib = lib_of(x)
+                x1 = x[0]
+                fact1 = (6*x1 - 2)**2;
+                fact2 = lib.sin(12*x1 - 4);
                 y = fact1 * fact2
-                return y[0]
+                return y
 
             self.obj = obj
             self.cns = None
@@ -1296,27 +1446,29 @@ class NonCons:
             http://www-optima.amp.i.kyoto-u.ac.jp/member/student/hedar/Hedar_files/TestGO.htm
             """
 
+            alpha = [1.0, 1.2, 3.0, 3.2]
+            A = [
+                [3.0, 10, 30],
+                [0.1, 10, 35],
+                [3.0, 10, 30],
+                [0.1, 10, 35]]
+            P = (10.0**(-4.0) * np.array([
+                [3689, 1170, 2673],
+                [4699, 4387, 7470],
+                [1091, 8732, 5547],
+                [381, 5743, 8828]])).tolist()
+
             def obj(x):
-                alpha = [1.0, 1.2, 3.0, 3.2]
-                A = np.array([
-                    [3.0, 10, 30],
-                    [0.1, 10, 35],
-                    [3.0, 10, 30],
-                    [0.1, 10, 35]])
-                P = 10.0**(-4.0) * np.array([
-                    [3689, 1170, 2673],
-                    [4699, 4387, 7470],
-                    [1091, 8732, 5547],
-                    [381, 5743, 8828]])
+                lib = lib_of(x)
                 outer = 0.0
                 for ii in range(4):
                     inner = 0
                     for jj in range(3):
                         xj = x[jj]
-                        Aij = A[ii, jj]
-                        Pij = P[ii, jj]
+                        Aij = A[ii][jj]
+                        Pij = P[ii][jj]
                         inner = inner + Aij*(xj-Pij)**2
-                    new = alpha[ii] * np.exp(-inner)
+                    new = alpha[ii] * lib.exp(-inner)
                     outer = outer + new
                 f = - outer
                 return f
@@ -1347,30 +1499,27 @@ class NonCons:
             infill criteria for noisy optimization.
             """
 
-            def obj(x):
-
-                a = np.empty([4, 6])
-                a[0,0]=10.0;	a[0,1]=3.0;		a[0,2]=17.0;	a[0,3]=3.5;		a[0,4]=1.7;		a[0,5]=8.0
-                a[1,0]=0.05;	a[1,1]=10.0;	a[1,2]=17.0;	a[1,3]=0.1;		a[1,4]=8.0;		a[1,5]=14.0
-                a[2,0]=3.0;		a[2,1]=3.5;		a[2,2]=1.7;		a[2,3]=10.0;	a[2,4]=17.0;	a[2,5]=8.0
-                a[3,0]=17.0;	a[3,1]=8.0;		a[3,2]=0.05;	a[3,3]=10.0;	a[3,4]=0.1;		a[3,5]=14.0
-
-                c = np.empty([4])
-                c[0]=1.0;   c[1]=1.2;   c[2]=3.0;   c[3]=3.2
-
-                p = np.empty([4, 6])
-                p[0,0]=0.1312;	p[0,1]=0.1696;	p[0,2]=0.5569;	p[0,3]=0.0124;	p[0,4]=0.8283;	p[0,5]=0.5886
-                p[1,0]=0.2329;	p[1,1]=0.4135;	p[1,2]=0.8307;	p[1,3]=0.3736;	p[1,4]=0.1004;	p[1,5]=0.9991
-                p[2,0]=0.2348;	p[2,1]=0.1451;	p[2,2]=0.3522;	p[2,3]=0.2883;	p[2,4]=0.3047;	p[2,5]=0.6650
-                p[3,0]=0.4047;	p[3,1]=0.8828;	p[3,2]=0.8732;	p[3,3]=0.5743;	p[3,4]=0.1091;	p[3,5]=0.0381
+            a = [
+                [10.0, 3.0, 17.0, 3.5, 1.7, 8.0],
+                [0.05, 10.0, 17.0, 0.1, 8.0, 14.0],
+                [3.0, 3.5, 1.7, 10.0, 17.0, 8.0],
+                [17.0, 8.0, 0.05, 10.0, 0.1, 14.0]]
+            c = [1.0, 1.2, 3.0, 3.2]
+            p = [
+                [0.1312, 0.1696, 0.5569, 0.0124, 0.8283, 0.5886],
+                [0.2329, 0.4135, 0.8307, 0.3736, 0.1004, 0.9991],
+                [0.2348, 0.1451, 0.3522, 0.2883, 0.3047, 0.6650],
+                [0.4047, 0.8828, 0.8732, 0.5743, 0.1091, 0.0381]]
 
+            def obj(x):
+                lib = lib_of(x)
                 s = 0
 
                 for i in range(1, 5):
                     sm = 0
                     for j in range(1, 5):
-                        sm = sm+a[i-1,j-1]*(x[j-1]-p[i-1,j-1])**2
-                    s = s+c[i-1]*np.exp(-sm)
+                        sm = sm+a[i-1][j-1]*(x[j-1]-p[i-1][j-1])**2
+                    s = s+c[i-1]*lib.exp(-sm)
                 s = 1.0/0.839 * (1.1 - s)
                 y = s
                 return y
@@ -1399,30 +1548,27 @@ class NonCons:
             infill criteria for noisy optimization.
             """
 
-            def obj(x):
-
-                a = np.empty([4, 6])
-                a[0,0]=10.0;	a[0,1]=3.0;		a[0,2]=17.0;	a[0,3]=3.5;		a[0,4]=1.7;		a[0,5]=8.0
-                a[1,0]=0.05;	a[1,1]=10.0;	a[1,2]=17.0;	a[1,3]=0.1;		a[1,4]=8.0;		a[1,5]=14.0
-                a[2,0]=3.0;		a[2,1]=3.5;		a[2,2]=1.7;		a[2,3]=10.0;	a[2,4]=17.0;	a[2,5]=8.0
-                a[3,0]=17.0;	a[3,1]=8.0;		a[3,2]=0.05;	a[3,3]=10.0;	a[3,4]=0.1;		a[3,5]=14.0
-
-                c = np.empty([4])
-                c[0]=1.0;   c[1]=1.2;   c[2]=3.0;   c[3]=3.2
-
-                p = np.empty([4, 6])
-                p[0,0]=0.1312;	p[0,1]=0.1696;	p[0,2]=0.5569;	p[0,3]=0.0124;	p[0,4]=0.8283;	p[0,5]=0.5886
-                p[1,0]=0.2329;	p[1,1]=0.4135;	p[1,2]=0.8307;	p[1,3]=0.3736;	p[1,4]=0.1004;	p[1,5]=0.9991
-                p[2,0]=0.2348;	p[2,1]=0.1451;	p[2,2]=0.3522;	p[2,3]=0.2883;	p[2,4]=0.3047;	p[2,5]=0.6650
-                p[3,0]=0.4047;	p[3,1]=0.8828;	p[3,2]=0.8732;	p[3,3]=0.5743;	p[3,4]=0.1091;	p[3,5]=0.0381
+            a = [
+                [10.0, 3.0, 17.0, 3.5, 1.7, 8.0],
+                [0.05, 10.0, 17.0, 0.1, 8.0, 14.0],
+                [3.0, 3.5, 1.7, 10.0, 17.0, 8.0],
+                [17.0, 8.0, 0.05, 10.0, 0.1, 14.0]]
+            c = [1.0, 1.2, 3.0, 3.2]
+            p = [
+                [0.1312, 0.1696, 0.5569, 0.0124, 0.8283, 0.5886],
+                [0.2329, 0.4135, 0.8307, 0.3736, 0.1004, 0.9991],
+                [0.2348, 0.1451, 0.3522, 0.2883, 0.3047, 0.6650],
+                [0.4047, 0.8828, 0.8732, 0.5743, 0.1091, 0.0381]]
 
+            def obj(x):
+                lib = lib_of(x)
                 s = 0
 
                 for i in range(1, 5):
                     sm = 0
                     for j in range(1, 7):
-                        sm = sm+a[i-1,j-1]*(x[j-1]-p[i-1,j-1])**2
-                    s = s+c[i-1]*np.exp(-sm)
+                        sm = sm+a[i-1][j-1]*(x[j-1]-p[i-1][j-1])**2
+                    s = s+c[i-1]*lib.exp(-sm)
 
                 y = -s
                 return y
@@ -1466,7 +1612,7 @@ class NonCons:
             self.cns = None
             self.lb = (np.ones(dimensions)*-dimensions).tolist()
             self.ub = (np.ones(dimensions)*dimensions).tolist()
-            self.xopt = [1, 2] # [3, 4, ...]
+            self.xopt = [float(ii) for ii in range(1, dimensions+1)]
             self.fopt = 0.0
 
         elif name == '6.11 Shekel Function 5':
@@ -1481,14 +1627,15 @@ class NonCons:
             -by-m-dimensional matrix
             """
 
+            m = 5
+            b = (0.1 * np.array([1, 2, 2, 4, 4, 6, 3, 7, 5, 5])).tolist()
+            C = [
+                [4.0, 1.0, 8.0, 6.0, 3.0, 2.0, 5.0, 8.0, 6.0, 7.0],
+                [4.0, 1.0, 8.0, 6.0, 7.0, 9.0, 5.0, 1.0, 2.0, 3.6],
+                [4.0, 1.0, 8.0, 6.0, 3.0, 2.0, 3.0, 8.0, 6.0, 7.0],
+                [4.0, 1.0, 8.0, 6.0, 7.0, 9.0, 3.0, 1.0, 2.0, 3.6]]
+
             def obj(x):
-                m = 5
-                b = 0.1 * np.array([1, 2, 2, 4, 4, 6, 3, 7, 5, 5])
-                C = np.array([
-                    [4.0, 1.0, 8.0, 6.0, 3.0, 2.0, 5.0, 8.0, 6.0, 7.0],
-                    [4.0, 1.0, 8.0, 6.0, 7.0, 9.0, 5.0, 1.0, 2.0, 3.6],
-                    [4.0, 1.0, 8.0, 6.0, 3.0, 2.0, 3.0, 8.0, 6.0, 7.0],
-                    [4.0, 1.0, 8.0, 6.0, 7.0, 9.0, 3.0, 1.0, 2.0, 3.6]])
                 outer = 0
 
                 for ii in range(1, m+1):
@@ -1496,7 +1643,7 @@ class NonCons:
                     inner = 0
                     for jj in range(1, 5):
                         xj = x[jj-1]
-                        Cji = C[jj-1, ii-1]
+                        Cji = C[jj-1][ii-1]
                         inner = inner + (xj-Cji)**2
                     outer = outer + 1/(inner+bi)
 
@@ -1528,14 +1675,15 @@ class NonCons:
             June 2013, from http://www.zsd.ict.pwr.wroc.pl/files/docs/functions.pdf.
             """
 
+            m = 7
+            b = (0.1 * np.array([1, 2, 2, 4, 4, 6, 3, 7, 5, 5])).tolist()
+            C = [
+                [4.0, 1.0, 8.0, 6.0, 3.0, 2.0, 5.0, 8.0, 6.0, 7.0],
+                [4.0, 1.0, 8.0, 6.0, 7.0, 9.0, 5.0, 1.0, 2.0, 3.6],
+                [4.0, 1.0, 8.0, 6.0, 3.0, 2.0, 3.0, 8.0, 6.0, 7.0],
+                [4.0, 1.0, 8.0, 6.0, 7.0, 9.0, 3.0, 1.0, 2.0, 3.6]]
+
             def obj(x):
-                m = 7
-                b = 0.1 * np.array([1, 2, 2, 4, 4, 6, 3, 7, 5, 5])
-                C = np.array([
-                    [4.0, 1.0, 8.0, 6.0, 3.0, 2.0, 5.0, 8.0, 6.0, 7.0],
-                    [4.0, 1.0, 8.0, 6.0, 7.0, 9.0, 5.0, 1.0, 2.0, 3.6],
-                    [4.0, 1.0, 8.0, 6.0, 3.0, 2.0, 3.0, 8.0, 6.0, 7.0],
-                    [4.0, 1.0, 8.0, 6.0, 7.0, 9.0, 3.0, 1.0, 2.0, 3.6]])
                 outer = 0
 
                 for ii in range(1, m+1):
@@ -1543,7 +1691,7 @@ class NonCons:
                     inner = 0
                     for jj in range(1, 5):
                         xj = x[jj-1]
-                        Cji = C[jj-1, ii-1]
+                        Cji = C[jj-1][ii-1]
                         inner = inner + (xj-Cji)**2
                     outer = outer + 1/(inner+bi)
 
@@ -1569,14 +1717,15 @@ class NonCons:
             -by-m-dimensional matrix
             """
 
+            m = 10
+            b = (0.1 * np.array([1, 2, 2, 4, 4, 6, 3, 7, 5, 5])).tolist()
+            C = [
+                [4.0, 1.0, 8.0, 6.0, 3.0, 2.0, 5.0, 8.0, 6.0, 7.0],
+                [4.0, 1.0, 8.0, 6.0, 7.0, 9.0, 5.0, 1.0, 2.0, 3.6],
+                [4.0, 1.0, 8.0, 6.0, 3.0, 2.0, 3.0, 8.0, 6.0, 7.0],
+                [4.0, 1.0, 8.0, 6.0, 7.0, 9.0, 3.0, 1.0, 2.0, 3.6]]
+
             def obj(x):
-                m = 10
-                b = 0.1 * np.array([1, 2, 2, 4, 4, 6, 3, 7, 5, 5])
-                C = np.array([
-                    [4.0, 1.0, 8.0, 6.0, 3.0, 2.0, 5.0, 8.0, 6.0, 7.0],
-                    [4.0, 1.0, 8.0, 6.0, 7.0, 9.0, 5.0, 1.0, 2.0, 3.6],
-                    [4.0, 1.0, 8.0, 6.0, 3.0, 2.0, 3.0, 8.0, 6.0, 7.0],
-                    [4.0, 1.0, 8.0, 6.0, 7.0, 9.0, 3.0, 1.0, 2.0, 3.6]])
                 outer = 0
 
                 for ii in range(1, m+1):
@@ -1584,7 +1733,7 @@ class NonCons:
                     inner = 0
                     for jj in range(1, 5):
                         xj = x[jj-1]
-                        Cji = C[jj-1, ii-1]
+                        Cji = C[jj-1][ii-1]
                         inner = inner + (xj-Cji)**2
                     outer = outer + 1/(inner+bi)
 
@@ -1619,8 +1768,15 @@ class NonCons:
                 y = sum/2.0
                 return y
 
+            def delta(x, i, new, f):
+                old = x[i]
+                term_old = old**4 - 16*old**2 + 5*old
+                term_new = new**4 - 16*new**2 + 5*new
+                return f + (term_new - term_old)/2.0
+
             self.obj = obj
             self.cns = None
+            self.delta = delta
             self.lb = (np.ones(dimensions)*-5.0).tolist()
             self.ub = (np.ones(dimensions)*5.0).tolist()
             self.xopt = (np.ones(dimensions)*-2.903534).tolist()
@@ -1629,8 +1785,7 @@ class NonCons:
         else:
             raise "Unkown problem name."
 
-    def __str__(self):
-        string = ''
-        for line in self.__doc__.split('\n'):
-            string += line.lstrip() + '\n'
-        return string
+        self.name = name
+        self.dimensions = dimensions
+        self.dtype = np.dtype(dtype)
+        self.structure = structure_of(name, dimensions)
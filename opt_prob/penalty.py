@@ -0,0 +1,172 @@
+"""
+Penalty transforms:
+turn a constrained problem (Cons) into a non-constrained one that is used
+like a NonCons, with cns = None.
+"""
+
+import numpy as np
+
+from .base import Wrapper
+
+
+class StaticPenalty(Wrapper):
+
+    """
+    Descriptions:
+        Static penalty, f(x) + weight*sum(max(g(x), 0)**power)
+    Args:
+        problem (Cons): constrained problem
+        weight (float): penalty weight
+        power (float): exponent applied to each violation
+    Attributes:
+        obj (func): penalized obj function
+        cns (None):
+        weight (float): penalty weight
+        power (float): exponent applied to each violation
+        lb, ub, xopt, fopt: those of the constrained problem
+    """
+
+    def __init__(self, problem, weight=1e3, power=2):
+
+        Wrapper.__init__(self, problem)
+        self.weight = weight
+        self.power = power
+
+        f = problem.obj
+        cns = problem.cns
+
+        def obj(x):
+            v = np.maximum(cns(x), 0.0) # nan stays nan, as in violation_batch
+            return f(x) + self.weight*np.sum(v**power, axis=0)
+
+        self.obj = obj
+        self.cns = None
+        self.delta = None
+        self.structure = None
+        self.__doc__ = """
+            Static penalty, weight = {}, power = {}
+            """.format(weight, power) + problem.__doc__
+
+    def obj_batch(self, X, out=None, max_bytes=None):
+        F = self.problem.obj_batch(X, out, max_bytes)
+        V = self.problem.violation_batch(X, self.power)
+        V *= self.weight
+        F += V
+        return F
+
+
+class AdaptivePenalty(StaticPenalty):
+
+    """
+    Descriptions:
+        Adaptive penalty of Hadj-Alouane and Bean. Every obj_batch call is
+        taken as one generation: if the best point of each of the last
+        `window` generations was infeasible the weight is multiplied by
+        `increase`, if they were all feasible it is divided by `decrease`.
+        Single point obj calls do not change the weight.
+    Args:
+        problem (Cons): constrained problem
+        weight (float): initial penalty weight
+        power (float): exponent applied to each violation
+        increase (float): weight factor after infeasible generations
+        decrease (float): weight divisor after feasible generations
+        window (int): number of generations looked back
+    Attributes:
+        weight (float): current penalty weight
+        history (List[bool]): feasibility of the best point of recent generations
+    """
+
+    def __init__(self, problem, weight=1.0, power=2, increase=2.0, decrease=1.5, window=5):
+
+        StaticPenalty.__init__(self, problem, weight, power)
+        self.increase = increase
+        self.decrease = decrease
+        self.window = window
+        self.history = []
+        self.__doc__ = """
+            Adaptive penalty, initial weight = {}, power = {}
+            """.format(weight, power) + problem.__doc__
+
+    def obj_batch(self, X, out=None, max_bytes=None):
+
+        P = self.problem.obj_batch(X, out, max_bytes)
+        V = self.problem.violation_batch(X, self.power)
+        P += self.weight*V
+
+        if P.size > 0:
+            best = np.argmin(P)
+            self.history = self.history[-(self.window-1):] + [bool(V[best] == 0.0)]
+            if len(self.history) == self.window:
+                if not any(self.history):
+                    self.weight = self.weight*self.increase
+                elif all(self.history):
+                    self.weight = self.weight/self.decrease
+        return P
+
+
+class AugLagrangian(Wrapper):
+
+    """
+    Descriptions:
+        Augmented Lagrangian of the inequality cns g(x) <= 0,
+        f(x) + sum(max(0, lam + rho*g(x))**2 - lam**2) / (2*rho).
+        Minimize it for fixed multipliers, then call update at the minimizer
+        and repeat.
+    Args:
+        problem (Cons): constrained problem
+        rho (float): penalty parameter
+        lam (List[float]): initial multipliers, zeros by default
+    Attributes:
+        rho (float): penalty parameter
+        lam (np.ndarray): current multipliers, one per cns
+    """
+
+    def __init__(self, problem, rho=10.0, lam=None):
+
+        Wrapper.__init__(self, problem)
+        m = len(problem.cns_funcs)
+        self.rho = rho
+        self.lam = np.zeros(m) if lam is None else np.array(lam, dtype=float)
+
+        f = problem.obj
+        cns = problem.cns
+
+        def obj(x):
+            rho = self.rho
+            lam = self.lam
+            t = np.maximum(lam + rho*cns(x), 0.0) # nan stays nan, as in obj_batch
+            return f(x) + np.sum(t*t - lam*lam)/(2.0*rho)
+
+        self.obj = obj
+        self.cns = None
+        self.delta = None
+        self.structure = None
+        self.__doc__ = """
+            Augmented Lagrangian, rho = {}
+            """.format(rho) + problem.__doc__
+
+    def obj_batch(self, X, out=None, max_bytes=None):
+        F = self.problem.obj_batch(X, out, max_bytes)
+        T = self.problem.cns_batch(X, max_bytes=max_bytes)
+        T *= self.rho
+        T += self.lam
+        np.maximum(T, 0.0, out=T)
+        T *= T
+        T -= self.lam**2
+        F += T.sum(axis=1)/(2.0*self.rho)
+        return F
+
+    def update(self, x, rho_factor=1.0):
+
+        """
+        Descriptions:
+            Multiplier update lam = max(0, lam + rho*g(x)) at the minimizer x
+            of the current subproblem
+        Args:
+            x (List[float]): minimizer of the current subproblem
+            rho_factor (float): factor applied to rho after the update
+        """
+
+        g = self.problem.cns(x)
+        self.lam = np.maximum(0.0, self.lam + self.rho*g)
+        self.rho = self.rho*rho_factor
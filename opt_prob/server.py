@@ -0,0 +1,224 @@
+"""
+Local evaluation server, `python -m opt_prob serve`.
+
+Solvers in other processes or languages connect over a Unix socket or
+localhost TCP and send evaluation requests. Requests for the same problem
+that arrive within `window` seconds of each other are stacked and evaluated
+as one batch.
+
+Wire format, little-endian, any number of requests per connection:
+
+    request:  uint8 method (0 obj, 1 cns)
+              uint16 length of the name
+              uint32 d, number of variables
+              uint32 n, number of points
+              name, utf-8
+              n*d float64, the points row by row
+    response: uint8 status (0 ok, 1 error)
+              uint32 n
+              uint32 m, values per point (1 for obj, number of cns)
+              n*m float64 row by row if ok, else n bytes of utf-8 message
+
+A request whose points take more than `max_bytes` is answered with an
+error and its connection is closed, before the points are read.
+"""
+
+import asyncio
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .cons import Cons
+from .non_cons import NonCons
+
+REQUEST = struct.Struct('<BHII')
+RESPONSE = struct.Struct('<BII')
+METHODS = ['obj_batch', 'cns_batch']
+
+_problems = {}
+
+
+def get_problem(name, dimensions=2, dtype='float64'):
+
+    """
+    Descriptions:
+        Build a problem from its name, once per (name, dimensions, dtype)
+    Args:
+        name (str): name in Cons.names or NonCons.names
+        dimensions (int): dimensions of a scalable problem
+        dtype (str): float type of the batch evaluations
+    Returns:
+        Cons or NonCons: the problem
+    """
+
+    key = (name, dimensions, dtype)
+    if key not in _problems:
+        if name in Cons.names:
+            _problems[key] = Cons(name, dimensions, dtype)
+        elif name in NonCons.names:
+            _problems[key] = NonCons(name, dimensions, dtype)
+        else:
+            raise ValueError("Unkown problem name.")
+    return _problems[key]
+
+
+def values_per_point(problem, method):
+
+    """ number of values per point of obj_batch (1) or cns_batch (number of cns, 0 without cns) """
+
+    if method == 'obj_batch':
+        return 1
+    return len(getattr(problem, 'cns_funcs', None) or [])
+
+
+class Server(object):
+
+    """
+    Descriptions:
+        Evaluation server coalescing concurrent requests into batches
+    Args:
+        window (float): seconds a request waits for others to join its batch
+        max_batch (int): number of points that triggers a batch at once
+        max_bytes (int): largest accepted request, in bytes of points
+    """
+
+    def __init__(self, window=0.001, max_batch=4096, max_bytes=256*2**20):
+
+        self.window = window
+        self.max_batch = max_batch
+        self.max_bytes = max_bytes
+        self.pending = {}
+        self.timers = {}
+        self.executor = ThreadPoolExecutor(1)
+
+    def submit(self, name, dimensions, method, X):
+
+        """ queue points for evaluation, returns a future of their values """
+
+        loop = asyncio.get_running_loop()
+        key = (name, dimensions, method)
+        future = loop.create_future()
+
+        if key not in self.pending:
+            self.pending[key] = []
+            self.timers[key] = loop.call_later(self.window, self.flush, key)
+        queue = self.pending[key]
+        queue.append((X, future))
+        if sum(len(x) for x, _ in queue) >= self.max_batch:
+            self.flush(key)
+        return future
+
+    def flush(self, key):
+
+        """ evaluate the queued points of one problem as one batch """
+
+        timer = self.timers.pop(key, None)
+        if timer is not None: # flushed at max_batch before its window ended
+            timer.cancel()
+        queue = self.pending.pop(key, None)
+        if not queue:
+            return
+        loop = asyncio.get_running_loop()
+        name, dimensions, method = key
+        X = np.vstack([x for x, _ in queue])
+
+        def evaluate():
+            return getattr(get_problem(name, dimensions), method)(X)
+
+        def done(batch):
+            try:
+                Y = batch.result()
+            except Exception as e:
+                for _, future in queue:
+                    future.set_exception(e)
+                return
+            i = 0
+            for x, future in queue:
+                future.set_result(Y[i:i+len(x)])
+                i += len(x)
+
+        loop.run_in_executor(self.executor, evaluate).add_done_callback(done)
+
+    async def handle(self, reader, writer):
+
+        """ answer the requests of one connection until it closes """
+
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(REQUEST.size)
+                except asyncio.IncompleteReadError:
+                    break
+                method, length, d, n = REQUEST.unpack(header)
+                name = (await reader.readexactly(length)).decode('utf-8')
+                if 8*n*d > self.max_bytes: # the points are not read, the connection ends
+                    message = "Request of {} bytes over the {} bytes limit.".format(8*n*d, self.max_bytes)
+                    message = message.encode('utf-8')
+                    writer.write(RESPONSE.pack(1, len(message), 0) + message)
+                    await writer.drain()
+                    break
+                X = np.frombuffer(await reader.readexactly(8*n*d), dtype='<f8').reshape(n, d)
+                try:
+                    if method >= len(METHODS):
+                        raise ValueError("Unkown method.")
+                    if n == 0: # nothing to stack, only the number of values per point
+                        m = values_per_point(get_problem(name, d), METHODS[method])
+                        writer.write(RESPONSE.pack(0, 0, m))
+                        await writer.drain()
+                        continue
+                    Y = await self.submit(name, d, METHODS[method], X)
+                    Y = np.ascontiguousarray(Y, dtype='<f8').reshape(n, -1)
+                    writer.write(RESPONSE.pack(0, n, Y.shape[1]) + Y.tobytes())
+                except Exception as e:
+                    message = str(e).encode('utf-8')
+                    writer.write(RESPONSE.pack(1, len(message), 0) + message)
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8765, path=None):
+
+        """ serve forever, on a Unix socket if path is given, else on host:port """
+
+        if path is not None:
+            server = await asyncio.start_unix_server(self.handle, path=path)
+        else:
+            server = await asyncio.start_server(self.handle, host=host, port=port)
+        async with server:
+            await server.serve_forever()
+
+
+def evaluate(sock, name, X, method='obj'):
+
+    """
+    Descriptions:
+        Reference client, evaluate points on a connected server
+    Args:
+        sock (socket.socket): socket connected to the server
+        name (str): problem's name
+        X (np.ndarray): points, shape (n, d)
+        method (str): 'obj' or 'cns'
+    Returns:
+        np.ndarray: values, shape (n,) for obj and (n, number of cns) for cns
+    """
+
+    X = np.ascontiguousarray(X, dtype='<f8')
+    n, d = X.shape
+    data = name.encode('utf-8')
+    sock.sendall(REQUEST.pack(['obj', 'cns'].index(method), len(data), d, n) + data + X.tobytes())
+
+    def receive(size):
+        buf = b''
+        while len(buf) < size:
+            chunk = sock.recv(size - len(buf))
+            if not chunk:
+                raise ConnectionError("Server closed the connection.")
+            buf += chunk
+        return buf
+
+    status, n, m = RESPONSE.unpack(receive(RESPONSE.size))
+    if status != 0:
+        raise ValueError(receive(n).decode('utf-8'))
+    Y = np.frombuffer(receive(8*n*m), dtype='<f8').reshape(n, m)
+    return Y[:, 0] if method == 'obj' else Y
@@ -0,0 +1,207 @@
+"""
+Structure index of the problem collections:
+separability, variable interactions and constraint dependencies.
+
+The index is written down from the formulas in cons.py and non_cons.py, so
+it can be queried without building or evaluating any problem.
+"""
+
+# -- obj interaction graph
+#    (dimensions, pattern), dimensions None means the problem is scalable.
+#    pattern is 'separable', 'chain' (x[i] interacts with x[i+1]), 'dense'
+#    (every pair interacts) or an explicit list of interacting pairs.
+
+_OBJ = {
+    # Cons
+    "1.4 G4 Problem": (5, [(0, 4)]),
+    "1.6 G6 Problem": (2, 'separable'),
+    "1.7 G7 Problem": (10, [(0, 1)]),
+    "1.8 G8 Problem": (2, 'dense'),
+    "1.9 G9 Problem": (7, [(5, 6)]),
+    "1.10 G10 Problem": (8, 'separable'),
+    "2.1 ALKYLATION": (7, [(3, 4)]),
+    "2.2 CAMEL": (2, 'dense'),
+    "2.3 FUNC2D": (2, 'dense'),
+    "2.4 GOLDPR": (2, 'dense'),
+    "2.5 GOMEZ": (2, 'dense'),
+    "2.6 HS23": (2, 'separable'),
+    "2.8 KS224": (2, 'separable'),
+    "2.9 KS250": (3, 'dense'),
+    "2.10 KS346": (3, 'dense'),
+    "2.11 NEWBRANIN": (2, 'separable'),
+    "2.12 PRES": (2, 'separable'),
+    # NonCons
+    "1.1 Ackley Function": (None, 'dense'),
+    "1.2 Bukin Function N. 6": (2, 'dense'),
+    "1.3 Cross-in-Tray Function": (2, 'dense'),
+    "1.4 Drop-Wave Function": (2, 'dense'),
+    "1.5 Eggholder Function": (2, 'dense'),
+    "1.6 Gramacy and Lee (2012) Function": (1, 'separable'),
+    "1.7 Griewank Function": (None, 'dense'),
+    "1.8 Holder Table Function": (2, 'dense'),
+    "1.10 Levy Function": (2, 'separable'),
+    "1.11 Levy Function N. 13": (2, 'dense'),
+    "1.12 Rastrigin Function": (None, 'separable'),
+    "1.13 Schaffer Function N. 2": (2, 'dense'),
+    "1.14 Schaffer Function N. 4": (2, 'dense'),
+    "1.15 Schwefel Function": (None, 'separable'),
+    "1.16 Shubert Function": (2, 'dense'),
+    "2.1 Bohachevsky Function": (2, 'separable'),
+    "2.2 Perm Function": (None, 'dense'),
+    "2.3 Rotated Hyper-Ellipsoid Function": (None, 'separable'),
+    "2.4 Sphere Function Modified": (6, 'separable'),
+    "2.5 Sum of Different Powers Function": (None, 'separable'),
+    "2.6 Sum Squares Function": (None, 'separable'),
+    "2.7 Trid Function": (None, 'chain'),
+    "3.1 Booth Function": (2, 'dense'),
+    "3.2 Matyas Function": (2, 'dense'),
+    "3.3 McCormick Function": (2, 'dense'),
+    "3.5 Zakharov Function": (None, 'dense'),
+    "4.1 Three-Hump Camel Function": (2, 'dense'),
+    "4.2 Six-Hump Camel Function": (2, 'dense'),
+    "4.3 Dixon-Price Function": (None, 'chain'),
+    "4.4 Rosenbrock Function": (None, 'chain'),
+    "5.2 Easom Function": (2, 'dense'),
+    "5.3 Michalewicz Function": (None, 'separable'),
+    "6.1 Beale Function": (2, 'dense'),
+    "6.2 Branin Function": (2, 'dense'),
+    "6.3 Colville Function": (4, [(0, 1), (2, 3), (1, 3)]),
+    "6.4 Forrester et al. (2008) Function": (1, 'separable'),
+    "6.5 Goldstein-Price Function": (2, 'dense'),
+    "6.6 Hartmann 3-D Function": (3, 'dense'),
+    "6.7 Hartmann 4-D Function": (4, 'dense'),
+    "6.8 Hartmann 6-D Function": (6, 'dense'),
+    "6.9 Perm Function": (None, 'dense'),
+    "6.11 Shekel Function 5": (4, 'dense'),
+    "6.12 Shekel Function 7": (4, 'dense'),
+    "6.13 Shekel Function 10": (4, 'dense'),
+    "6.14 Styblinski-Tang Function": (None, 'separable'),
+    }
+
+# -- variables the obj depends on, when not all of them
+
+_OBJ_VARS = {
+    "1.4 G4 Problem": [0, 2, 4],
+    "1.10 G10 Problem": [0, 1, 2],
+    "2.1 ALKYLATION": [0, 1, 2, 3, 4],
+    }
+
+# -- variables each cns output depends on
+
+_CNS_VARS = {
+    "1.4 G4 Problem": [
+        [0, 1, 2, 3, 4], [0, 1, 2, 3, 4],
+        [0, 1, 2, 4], [0, 1, 2, 4],
+        [0, 2, 3, 4], [0, 2, 3, 4]],
+    "1.6 G6 Problem": [[0, 1], [0, 1]],
+    "1.7 G7 Problem": [
+        [0, 1, 6, 7], [0, 1, 6, 7], [0, 1, 8, 9], [0, 1, 2, 3],
+        [0, 1, 2, 3], [0, 1, 4, 5], [0, 1, 4, 5], [0, 1, 8, 9]],
+    "1.8 G8 Problem": [[0, 1], [0, 1]],
+    "1.9 G9 Problem": [
+        [0, 1, 2, 3, 4], [0, 1, 2, 3, 4], [0, 1, 5, 6], [0, 1, 2, 5, 6]],
+    "1.10 G10 Problem": [
+        [3, 5], [3, 4, 6], [4, 7], [0, 3, 5], [1, 3, 4, 6], [2, 4, 7]],
+    "2.1 ALKYLATION": [
+        [0, 1, 3], [0, 1, 3], [0, 1, 2, 3, 4, 5], [0, 1, 2, 3, 4, 5],
+        [5, 6], [5, 6], [4, 6], [4, 6], [0, 3], [0, 3],
+        [2, 3, 5], [2, 3, 5], [0, 1, 3], [0, 1, 3]],
+    "2.2 CAMEL": [[0, 1]],
+    "2.3 FUNC2D": [[0, 1]],
+    "2.4 GOLDPR": [[0, 1], [0, 1]],
+    "2.5 GOMEZ": [[0, 1]],
+    "2.6 HS23": [[0, 1], [0, 1], [0, 1], [0, 1], [0, 1]],
+    "2.8 KS224": [[0, 1], [0, 1], [0, 1], [0, 1]],
+    "2.9 KS250": [[0, 1, 2], [0, 1, 2]],
+    "2.10 KS346": [[0, 1], [0, 2]],
+    "2.11 NEWBRANIN": [[0, 1]],
+    "2.12 PRES": [[0, 1], [0, 1], [0, 1]],
+    }
+
+_cache = {}
+
+
+def structure_of(name, dimensions=2):
+
+    """
+    Descriptions:
+        Look up the structure of a problem without building it. The returned
+        dict is cached and shared, treat it as read-only.
+    Args:
+        name (str): problem's name
+        dimensions (int): dimensions of a scalable problem
+    Returns:
+        dict:
+            dimensions (int): number of variables
+            separability (str): 'separable', 'block-separable' or 'non-separable'
+            blocks (List[List[int]]): groups of obj variables that interact
+                with each other, one list per independent subproblem
+            edges (List[tuple]): interacting pairs (i, j) with i < j, None
+                if every pair inside a block interacts
+            obj_vars (List[int]): variables the obj depends on
+            cns_vars (List[List[int]]): variables each cns output depends
+                on, None for non-constrained problems
+    """
+
+    key = (name, dimensions)
+    if key in _cache:
+        return _cache[key]
+
+    if name not in _OBJ:
+        raise ValueError("Unkown problem name.")
+
+    n, pattern = _OBJ[name]
+    if n is None:
+        n = dimensions
+
+    if pattern == 'separable':
+        edges = []
+        blocks = [[i] for i in range(n)]
+    elif pattern == 'dense':
+        edges = None
+        blocks = [list(range(n))]
+    elif pattern == 'chain':
+        edges = [(i, i+1) for i in range(n-1)]
+        blocks = [list(range(n))]
+    else:
+        edges = sorted((min(i, j), max(i, j)) for i, j in pattern)
+        blocks = _components(n, edges)
+
+    if len(blocks) == n:
+        separability = 'separable'
+    elif len(blocks) == 1:
+        separability = 'non-separable'
+    else:
+        separability = 'block-separable'
+
+    info = {
+        'dimensions': n,
+        'separability': separability,
+        'blocks': blocks,
+        'edges': edges,
+        'obj_vars': _OBJ_VARS.get(name, list(range(n))),
+        'cns_vars': _CNS_VARS.get(name),
+        }
+    _cache[key] = info
+    return info
+
+
+def _components(n, edges):
+
+    """ connected components of the interaction graph, by union-find """
+
+    parent = list(range(n))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in edges:
+        parent[find(i)] = find(j)
+
+    groups = {}
+    for i in range(n):
+        groups.setdefault(find(i), []).append(i)
+    return sorted(groups.values())
@@ -0,0 +1,487 @@
+"""
+Problem transforms:
+change the coordinates or the scale a problem is seen in, used like the
+problem itself.
+"""
+
+import numpy as np
+
+from .base import Wrapper
+
+
+class Normalized(Wrapper):
+
+    """
+    Descriptions:
+        Problem seen on the unit hypercube. A point u in [0, 1]^d is mapped
+        to x = lb + (ub - lb)*u before evaluation, with the scale and offset
+        arrays computed once. A list point stays a list, anything else
+        (arrays, stacked points, intervals) keeps its type, so lib_of picks
+        the same library as for the problem itself. delta takes and moves
+        coordinates on the unit hypercube.
+    Args:
+        problem (Cons or NonCons): problem to normalize
+    Attributes:
+        lb (np.ndarray): zeros
+        ub (np.ndarray): ones
+        xopt (np.ndarray): known solutions on the unit hypercube, shape (k, d)
+        offset (np.ndarray): lb of the problem
+        scale (np.ndarray): ub - lb of the problem
+    """
+
+    def __init__(self, problem):
+
+        Wrapper.__init__(self, problem)
+
+        self.offset = np.array(problem.lb, dtype=float)
+        self.scale = np.array(problem.ub, dtype=float) - self.offset
+        offset = self.offset.tolist()
+        scale = self.scale.tolist()
+        n = len(offset)
+
+        def to_x(u):
+            if type(u) is list or type(u) is tuple:
+                return [offset[i] + scale[i]*u[i] for i in range(n)]
+            shape = (n,) + (1,)*(np.ndim(u) - 1) # stacked points are (d, n)
+            return self.offset.reshape(shape) + self.scale.reshape(shape)*u
+
+        f = problem.obj
+        self.obj = lambda u: f(to_x(u))
+
+        if problem.delta is not None:
+            d = problem.delta
+            self.delta = lambda u, i, new, fu: d(to_x(u), i, offset[i] + scale[i]*new, fu)
+
+        if problem.cns is not None:
+            g = problem.cns
+            self.cns = lambda u: g(to_x(u))
+            self.cns_funcs = [(lambda u, gk=gk: gk(to_x(u))) for gk in problem.cns_funcs]
+
+        self.lb = np.zeros(n)
+        self.ub = np.ones(n)
+        self.xopt = self.to_unit(problem.xopt)
+        self.structure = problem.structure
+
+    def from_unit(self, U, out=None):
+
+        """
+        Descriptions:
+            Map points from the unit hypercube to the problem's box
+        Args:
+            U (np.ndarray): points on the unit hypercube, shape (n, d) or (d,)
+            out (np.ndarray): optional array receiving the result
+        Returns:
+            np.ndarray: points in the problem's box
+        """
+
+        out = np.multiply(U, self.scale, out=out)
+        out += self.offset
+        return out
+
+    def to_unit(self, X, out=None):
+
+        """
+        Descriptions:
+            Map points from the problem's box to the unit hypercube
+        Args:
+            X (np.ndarray): points in the problem's box, shape (n, d) or (d,)
+            out (np.ndarray): optional array receiving the result
+        Returns:
+            np.ndarray: points on the unit hypercube
+        """
+
+        out = np.subtract(X, self.offset, out=out)
+        out /= self.scale
+        return out
+
+    def clip(self, U, out=None):
+
+        """
+        Descriptions:
+            Project points onto the unit hypercube, pass out=U to clip in place
+        Args:
+            U (np.ndarray): points, shape (n, d) or (d,)
+            out (np.ndarray): optional array receiving the result
+        Returns:
+            np.ndarray: projected points
+        """
+
+        return np.clip(U, 0.0, 1.0, out=out)
+
+    def obj_batch(self, U, out=None, max_bytes=None):
+        return self.problem.obj_batch(self.from_unit(U), out, max_bytes)
+
+    def cns_batch(self, U, out=None, max_bytes=None):
+        return self.problem.cns_batch(self.from_unit(U), out, max_bytes)
+
+
+class Scaled(Wrapper):
+
+    """
+    Descriptions:
+        Problem with scaled variables, obj and cns. The variables become
+        y = x/x_scale, by default the width of the box, so that every
+        variable moves over a range of 1. obj and each cns are then divided
+        by a factor following the gradient-based rule of IPOPT: a function
+        whose gradient in y at the start point x0 is larger than `target`
+        (max norm) is scaled down so that it becomes `target`, smaller ones
+        are left alone. Solvers started from x0 on the scaled problem take
+        fewer iterations on badly scaled problems such as G10 and
+        ALKYLATION. Map their results back with unscale_x, unscale_obj,
+        unscale_cns and unscale_multipliers.
+    Args:
+        problem (Cons or NonCons): problem to scale
+        x0 (List[float]): start point of the solver, in x, the center of
+            the box by default
+        target (float): largest gradient left unscaled
+        obj_scale (float): use this obj factor instead of the computed one
+        cns_scale (List[float]): use these cns factors instead of the computed ones
+        x_scale (List[float]): use these variable factors instead of the box widths
+    Attributes:
+        x_scale (np.ndarray): x[i] = y[i]*x_scale[i]
+        obj_scale (float): obj is divided by this
+        cns_scale (np.ndarray): cns[k] is divided by cns_scale[k]
+    """
+
+    def __init__(self, problem, x0=None, target=100.0, obj_scale=None, cns_scale=None, x_scale=None):
+
+        Wrapper.__init__(self, problem)
+
+        lb = np.array(problem.lb, dtype=float)
+        ub = np.array(problem.ub, dtype=float)
+        if x_scale is None:
+            x_scale = np.where(ub - lb > 0.0, ub - lb, 1.0)
+        self.x_scale = np.array(x_scale, dtype=float)
+
+        if obj_scale is None or (cns_scale is None and problem.cns is not None):
+            x0 = (lb + ub)/2.0 if x0 is None else np.array(x0, dtype=float)
+            start_obj, start_cns = _gradient_scales(problem, x0, self.x_scale, target)
+            obj_scale = start_obj if obj_scale is None else obj_scale
+            cns_scale = start_cns if cns_scale is None else cns_scale
+        self.obj_scale = float(obj_scale)
+        self.cns_scale = np.array([] if cns_scale is None else cns_scale, dtype=float)
+
+        xs = self.x_scale.tolist()
+        n = len(xs)
+
+        def to_x(y):
+            if type(y) is list or type(y) is tuple:
+                return [xs[i]*y[i] for i in range(n)]
+            return self.x_scale.reshape((n,) + (1,)*(np.ndim(y) - 1))*y # stacked points are (d, n)
+
+        sf = self.obj_scale
+        f = problem.obj
+        self.obj = lambda y: f(to_x(y))/sf
+        if problem.delta is not None:
+            d = problem.delta
+            self.delta = lambda y, i, new, fy: d(to_x(y), i, xs[i]*new, fy*sf)/sf
+
+        if problem.cns is not None:
+            sg = self.cns_scale.tolist()
+            self.cns_funcs = [(lambda y, gk=gk, sk=sk: gk(to_x(y))/sk)
+                              for gk, sk in zip(problem.cns_funcs, sg)]
+            g = problem.cns
+            self.cns = lambda y: (g(to_x(y)).T/self.cns_scale).T
+
+        self.lb = lb/self.x_scale
+        self.ub = ub/self.x_scale
+        self.xopt = self.scale_x(problem.xopt)
+        self.fopt = problem.fopt/sf
+
+    def obj_batch(self, Y, out=None, max_bytes=None):
+        F = self.problem.obj_batch(self.unscale_x(Y), out, max_bytes)
+        F /= self.obj_scale
+        return F
+
+    def cns_batch(self, Y, out=None, max_bytes=None):
+        G = self.problem.cns_batch(self.unscale_x(Y), out, max_bytes)
+        G /= self.cns_scale
+        return G
+
+    def scale_x(self, X):
+
+        """ points of the scaled problem from points of the original one """
+
+        return np.asarray(X, dtype=float)/self.x_scale
+
+    def unscale_x(self, Y):
+
+        """ points of the original problem from points of the scaled one """
+
+        return np.asarray(Y, dtype=float)*self.x_scale
+
+    def unscale_obj(self, f):
+
+        """ obj value(s) of the original problem from scaled ones """
+
+        return np.asarray(f)*self.obj_scale
+
+    def unscale_cns(self, g):
+
+        """ cns values of the original problem from scaled ones, shape (..., number of cns) """
+
+        return np.asarray(g)*self.cns_scale
+
+    def unscale_multipliers(self, lam):
+
+        """
+        Descriptions:
+            Lagrange multipliers of the original problem from those of the
+            scaled problem, lam_k = lam_scaled_k*obj_scale/cns_scale_k
+        Args:
+            lam (np.ndarray): multipliers of the scaled cns
+        Returns:
+            np.ndarray: multipliers of the original cns
+        """
+
+        return np.asarray(lam)*self.obj_scale/self.cns_scale
+
+
+def _gradient_scales(problem, x0, x_scale, target):
+
+    """ max(1, max-norm gradient in y = x/x_scale at x0 / target) of obj and of each cns """
+
+    d = len(x0)
+    h = 1e-7*np.maximum(1.0, np.abs(x0))
+    X = x0 + np.vstack([np.zeros(d), np.diag(h)]) # x0, then one forward step per variable
+
+    with np.errstate(all='ignore'):
+        F = problem.obj_batch(X)
+        G = problem.cns_batch(X)
+        dF = np.abs(F[1:] - F[0])/h*x_scale
+        dG = np.abs(G[1:] - G[0])/h[:, None]*x_scale[:, None]
+
+    def scale(dy):
+        m = np.max(np.where(np.isfinite(dy), dy, 0.0), axis=0, initial=0.0)
+        return np.maximum(1.0, m/target)
+
+    return float(scale(dF)), scale(dG)
+
+
+_rotation_cache = {}
+
+
+def rotation_of(dimensions, seed=0, kind='householder', k=None):
+
+    """
+    Descriptions:
+        Random rotation R, orthogonal with det(R) = 1, generated once per
+        (dimensions, seed, kind, k) and cached.
+        'dense': Haar-distributed, QR of a Gaussian matrix, O(d^2) to apply.
+        'householder': product of k random reflections I - 2*v*v^T, and of
+            the reflection of the first coordinate when k is odd, O(d*k) to
+            apply, k = min(d, 8) by default. R - I has rank at most k + 1,
+            so with k much smaller than d, R stays close to the identity on
+            most directions.
+        'givens': k butterfly passes of random plane rotations, each pass
+            pairs i with i + 2^l for l = 0, ..., ceil(log2(d)) - 1,
+            O(d*k*log(d)) to apply, k = 2 by default.
+    Args:
+        dimensions (int): number of variables
+        seed (int): seed of the rotation
+        kind (str): 'householder', 'givens' or 'dense'
+        k (int): number of reflections or butterfly passes
+    Returns:
+        Rotation: the rotation
+    """
+
+    if kind == 'householder' and k is None:
+        k = min(dimensions, 8)
+    elif kind == 'givens' and k is None:
+        k = 2
+    elif kind == 'dense':
+        k = None
+    elif kind not in ('householder', 'givens'):
+        raise ValueError("Unkown rotation kind.")
+
+    key = (dimensions, seed, kind, k)
+    if key not in _rotation_cache:
+        _rotation_cache[key] = Rotation(dimensions, seed, kind, k)
+    return _rotation_cache[key]
+
+
+class Rotation(object):
+
+    """
+    Descriptions:
+        Orthogonal matrix kept in factored form, use `rotation_of` to get a
+        cached one
+    Args:
+        dimensions (int): number of variables
+        seed (int): seed of the rotation
+        kind (str): 'householder', 'givens' or 'dense'
+        k (int): number of reflections or butterfly passes
+    Attributes:
+        factors: dense matrix, unit reflection vectors of shape (k, d) or
+            list of (i, j, cos, sin) layers of plane rotations
+        flip (bool): whether the first coordinate is negated before the
+            reflections, so that an odd number of them still gives det = 1
+    """
+
+    def __init__(self, dimensions, seed, kind, k):
+
+        self.dimensions = dimensions
+        self.kind = kind
+        self.k = k
+        rs = np.random.RandomState(seed)
+        d = dimensions
+        self.flip = False
+
+        if kind == 'dense':
+            q, r = np.linalg.qr(rs.normal(size=(d, d)))
+            q = q*np.sign(np.diag(r))
+            if np.linalg.det(q) < 0.0: # a reflection, make it a rotation
+                q[:, 0] = -q[:, 0]
+            self.factors = q
+        elif kind == 'householder':
+            v = rs.normal(size=(k, d))
+            self.factors = v/np.linalg.norm(v, axis=1)[:, None]
+            self.flip = k % 2 == 1
+        else:
+            layers = []
+            for _ in range(k):
+                step = 1
+                while step < d:
+                    i = np.array([ii for ii in range(d) if not ii & step and ii + step < d], dtype=int)
+                    theta = rs.uniform(0.0, 2.0*np.pi, size=len(i))
+                    layers.append((i, i + step, np.cos(theta), np.sin(theta)))
+                    step = step*2
+            self.factors = layers
+
+    def apply(self, X, transpose=False):
+
+        """
+        Descriptions:
+            Rotate points, R*x for each row x of X (R^T*x with transpose)
+        Args:
+            X (np.ndarray): points, shape (n, d) or (d,)
+            transpose (bool): apply the inverse rotation R^T
+        Returns:
+            np.ndarray: rotated points, same shape as X
+        """
+
+        Z = np.array(X, dtype=float)
+        if self.kind == 'dense':
+            return Z.dot(self.factors) if transpose else Z.dot(self.factors.T)
+
+        # -- R = F_1*F_2*...*F_k*D, the last factor is applied first, with
+        #    D = diag(-1, 1, ..., 1) if flip, else I
+
+        factors = self.factors if transpose else self.factors[::-1]
+        if self.kind == 'householder':
+            if self.flip and not transpose:
+                Z[..., 0] = -Z[..., 0]
+            for v in factors:
+                Z -= 2.0*np.multiply.outer(Z.dot(v), v)
+            if self.flip and transpose:
+                Z[..., 0] = -Z[..., 0]
+        else:
+            for i, j, c, s in factors:
+                a = Z[..., i]
+                b = Z[..., j]
+                if transpose:
+                    Z[..., i], Z[..., j] = c*a + s*b, c*b - s*a
+                else:
+                    Z[..., i], Z[..., j] = c*a - s*b, s*a + c*b
+        return Z
+
+    def matrix(self):
+
+        """ R as a dense (d, d) array """
+
+        return self.apply(np.eye(self.dimensions)).T
+
+
+class ShiftedRotated(Wrapper):
+
+    """
+    Descriptions:
+        CEC-style instance F(R*(x - o) + x*) of a problem, with x* its
+        first known solution, o a random shift drawn in the middle 80% of the
+        box and R a random rotation from `rotation_of`. The solution moves to
+        o with the same fopt and every variable interacts with the others,
+        weakly for most of them when d is much larger than the k of a
+        'householder' rotation, use 'dense' or a larger k for more. The box is
+        kept, so F may be evaluated outside its original box.
+    Args:
+        problem (Cons or NonCons): problem to transform, with a known solution
+        seed (int): seed of the shift and of the rotation
+        rotation (str): 'householder', 'givens' or 'dense'
+        k (int): number of reflections or butterfly passes, see `rotation_of`
+    Attributes:
+        shift (np.ndarray): o, the new xopt
+        rotation (Rotation): R
+    """
+
+    def __init__(self, problem, seed=0, rotation='householder', k=None):
+
+        Wrapper.__init__(self, problem)
+
+        if len(problem.xopt) == 0:
+            raise ValueError("Problem without known solution.")
+        self.center = np.array(problem.xopt[0], dtype=float)
+
+        lb = np.array(problem.lb, dtype=float)
+        ub = np.array(problem.ub, dtype=float)
+        d = len(lb)
+        u = np.random.RandomState(seed).uniform(0.1, 0.9, size=d)
+        self.shift = lb + (ub - lb)*u
+        self.rotation = rotation_of(d, seed, rotation, k)
+
+        self.name = '{} shifted rotated {} {} {}'.format(problem.name, rotation, k, seed)
+        self.xopt = self.shift[None, :]
+        self.delta = None
+
+        def to_z(x):
+            return self.to_problem(np.array(x, dtype=float)).tolist()
+
+        f = problem.obj
+        self.obj = lambda x: f(to_z(x))
+
+        cns_vars = None
+        if problem.cns is not None:
+            g = problem.cns
+            self.cns = lambda x: g(to_z(x))
+            self.cns_funcs = [(lambda x, gk=gk: gk(to_z(x))) for gk in problem.cns_funcs]
+            cns_vars = [list(range(d)) for _ in problem.cns_funcs]
+
+        self.structure = {
+            'dimensions': d,
+            'separability': 'non-separable',
+            'blocks': [list(range(d))],
+            'edges': None,
+            'obj_vars': list(range(d)),
+            'cns_vars': cns_vars,
+            }
+        self.__doc__ = """
+            Shifted and rotated ({}, seed = {})
+            """.format(rotation, seed) + problem.__doc__
+
+    def to_problem(self, X):
+
+        """
+        Descriptions:
+            Map points to the coordinates of the wrapped problem, R*(x - o) + x*
+        Args:
+            X (np.ndarray): points, shape (n, d) or (d,)
+        Returns:
+            np.ndarray: points seen by the wrapped problem
+        """
+
+        Z = self.rotation.apply(np.subtract(X, self.shift))
+        Z += self.center
+        return Z
+
+    def from_problem(self, Z):
+
+        """ inverse of to_problem, R^T*(z - x*) + o """
+
+        X = self.rotation.apply(np.subtract(Z, self.center), transpose=True)
+        X += self.shift
+        return X
+
+    def obj_batch(self, X, out=None, max_bytes=None):
+        return self.problem.obj_batch(self.to_problem(X), out, max_bytes)
+
+    def cns_batch(self, X, out=None, max_bytes=None):
+        return self.problem.cns_batch(self.to_problem(X), out, max_bytes)
@@ -0,0 +1,56 @@
+"""
+Utilities shared by the problem collections.
+"""
+
+import math
+
+import numpy as np
+
+from . import interval
+
+
+def lib_of(x):
+
+    """
+    Descriptions:
+        Pick the math library used to evaluate a point. A single point given
+        as a Python list or tuple is evaluated with the scalar functions of
+        `math`, which skips the ufunc dispatch of NumPy on Python floats.
+        Boxes given as an interval.Interval are evaluated with interval
+        arithmetic (see Problem.bound). Everything else (ndarray points,
+        stacked points) goes through NumPy.
+    Args:
+        x (List[float]): point to evaluate
+    Returns:
+        module: `math`, `interval` or `numpy`
+    """
+
+    if type(x) is list or type(x) is tuple:
+        return math
+    if type(x) is interval.Interval:
+        return interval
+    return np
+
+
+def with_fallback(f):
+
+    """
+    Descriptions:
+        f evaluated on a list point with `math` (see lib_of), and again with
+        NumPy when `math` raises where NumPy gives nan or inf: a division
+        by zero, a domain error such as log(0) or sin(inf), or an overflow.
+    Args:
+        f (func): obj or cns function
+    Returns:
+        func: f with the NumPy fallback
+    """
+
+    def g(x):
+        try:
+            return f(x)
+        except (ValueError, ZeroDivisionError, OverflowError):
+            if type(x) is list or type(x) is tuple:
+                return f(np.array(x, dtype=float))
+            raise
+
+    return g